@@ -104,6 +104,12 @@ class AxiToolsBot(commands.Bot):
         except Exception:  # pragma: no cover - defensive logging
             LOGGER.exception("Failed to send error response for interaction")
 
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            self.storage.flush()
+
     # ------------------------------------------------------------------
     def get_config(self, guild_id: int) -> GuildConfig:
         return self.storage.get_config(guild_id)
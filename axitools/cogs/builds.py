@@ -17,6 +17,7 @@ from ..utils import build_embed, get_icon_and_color, resolve_profession
 from .. import constants
 
 SLUG_RE = re.compile(r"[^a-z0-9]+")
+_CLASS_CHOICES_BY_LOWER = {choice.lower(): choice for choice in constants.CLASS_CHOICES}
 
 
 def slugify(value: str) -> str:
@@ -171,11 +172,10 @@ class BuildsCog(commands.GroupCog, name="builds"):
 
     # ------------------------------------------------------------------
     def _normalise_class_selection(self, selection: str) -> str:
-        candidate = selection.strip()
-        for choice in constants.CLASS_CHOICES:
-            if candidate.lower() == choice.lower():
-                return choice
-        raise ValueError(f"Unknown class selection: {selection}")
+        choice = _CLASS_CHOICES_BY_LOWER.get(selection.strip().lower())
+        if choice is None:
+            raise ValueError(f"Unknown class selection: {selection}")
+        return choice
 
     async def handle_add_submission(
         self,
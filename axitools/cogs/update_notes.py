@@ -6,30 +6,35 @@ import logging
 import os
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from datetime import datetime, time, timezone
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Union
 
 import discord
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from discord import app_commands
 from discord.ext import commands, tasks
-from markdownify import markdownify as html_to_markdown
+from markdownify import MarkdownConverter
 
 from ..bot import AxiToolsBot
 from ..branding import BRAND_COLOUR
 from ..config_status import ConfigStatus, StatusField
-from ..rendering import clean_markdown
+from ..rendering import clean_markdown, truncate_embed_field
 from ..storage import UpdateNotesStatus
 
 LOGGER = logging.getLogger(__name__)
 
 
 GAME_UPDATE_NOTES_PAGE_URL = "https://wiki.guildwars2.com/wiki/Game_updates"
+# Only the article body is needed; skip building a tree for the wiki chrome.
+CONTENT_STRAINER = SoupStrainer(id="mw-content-text")
+_HEADING_DATE_RE = re.compile(r"([A-Za-z]+ \d{1,2}, \d{4})")
 EMBED_THUMBNAIL_URL = (
     "https://wiki.guildwars2.com/images/thumb/c/cd/"
     "Visions_of_Eternity_logo.png/244px-Visions_of_Eternity_logo.png"
 )
+EMBED_DESCRIPTION_LIMIT = 4000
 REQUEST_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
@@ -64,12 +69,21 @@ class PatchNotesEntry:
     summary: str
     content: str
     legacy_entry_ids: Sequence[str] = ()
+    published_dt: Optional[datetime] = None
+
+
+CHECK_INTERVAL_MINUTES = 15
+# Poll on fixed UTC quarter hours rather than drifting relative to start-up.
+CHECK_TIMES = [
+    time(hour=hour, minute=minute, tzinfo=timezone.utc)
+    for hour in range(24)
+    for minute in range(0, 60, CHECK_INTERVAL_MINUTES)
+]
 
 
 class UpdateNotesCog(commands.Cog):
     """Poll the official wiki page for new game update notes."""
 
-    CHECK_INTERVAL_MINUTES = 15
     EMBED_COLOR = BRAND_COLOUR
     PRODUCTION = os.getenv("PRODUCTION", "true").lower() in {"1", "true", "yes", "on"}
 
@@ -77,13 +91,16 @@ class UpdateNotesCog(commands.Cog):
         self.bot = bot
         self._session = requests.Session()
         self._session.headers.update(REQUEST_HEADERS)
+        self._page_etag: Optional[str] = None
+        self._page_last_modified: Optional[str] = None
+        self._page_entries: List[PatchNotesEntry] = []
         self._poll_updates.start()
 
     def cog_unload(self) -> None:  # pragma: no cover - discord.py lifecycle
         self._poll_updates.cancel()
         self._session.close()
 
-    @tasks.loop(minutes=CHECK_INTERVAL_MINUTES)
+    @tasks.loop(time=CHECK_TIMES)
     async def _poll_updates(self) -> None:
         if not self.bot.guilds:
             return
@@ -92,37 +109,62 @@ class UpdateNotesCog(commands.Cog):
         if not entries:
             return
 
-        for guild in self.bot.guilds:
-            config = self.bot.get_config(guild.id)
-            channel_id = config.update_notes_channel_id
-            if not channel_id:
-                continue
+        # Embeds are identical for every guild; build each one at most once per poll.
+        embed_cache: Dict[str, List[discord.Embed]] = {}
 
-            status = self.bot.storage.get_update_notes_status(guild.id)
-            if status is None or not status.last_entry_id:
-                latest = entries[0]
-                self.bot.storage.save_update_notes_status(
+        guilds = list(self.bot.guilds)
+        results = await asyncio.gather(
+            *(self._dispatch_for_guild(guild, entries, embed_cache) for guild in guilds),
+            return_exceptions=True,
+        )
+        for guild, result in zip(guilds, results):
+            if isinstance(result, BaseException):
+                LOGGER.error(
+                    "Failed to dispatch game update notes for guild %s",
                     guild.id,
-                    UpdateNotesStatus(
-                        last_entry_id=latest.entry_id,
-                        last_entry_published_at=latest.published_at,
-                    ),
+                    exc_info=result,
                 )
-                continue
 
-            new_entries = self._resolve_new_entries(
-                entries, status.last_entry_id, status.last_entry_published_at
+    async def _dispatch_for_guild(
+        self,
+        guild: discord.Guild,
+        entries: Sequence[PatchNotesEntry],
+        embed_cache: Dict[str, List[discord.Embed]],
+    ) -> None:
+        config = self.bot.get_config(guild.id)
+        channel_id = config.update_notes_channel_id
+        if not channel_id:
+            return
+
+        status = self.bot.storage.get_update_notes_status(guild.id)
+        if status is None or not status.last_entry_id:
+            latest = entries[0]
+            self.bot.storage.save_update_notes_status(
+                guild.id,
+                UpdateNotesStatus(
+                    last_entry_id=latest.entry_id,
+                    last_entry_published_at=latest.published_at,
+                ),
             )
-            if not new_entries:
-                continue
+            return
 
-            channel = await self._resolve_channel(guild, channel_id)
-            if not channel:
-                continue
+        new_entries = self._resolve_new_entries(
+            entries, status.last_entry_id, status.last_entry_published_at
+        )
+        if not new_entries:
+            return
 
+        channel = await self._resolve_channel(guild, channel_id)
+        if not channel:
+            return
+
+        posted = False
+        try:
             for entry in new_entries:
-                body = entry.content or entry.summary
-                embeds = self._build_embeds(entry, body)
+                embeds = embed_cache.get(entry.entry_id)
+                if embeds is None:
+                    embeds = self._build_embeds(entry, entry.content or entry.summary)
+                    embed_cache[entry.entry_id] = embeds
                 try:
                     for embed in embeds:
                         await channel.send(embed=embed)
@@ -135,6 +177,10 @@ class UpdateNotesCog(commands.Cog):
                     break
                 status.last_entry_id = entry.entry_id
                 status.last_entry_published_at = entry.published_at
+                posted = True
+        finally:
+            # Persist progress once per guild, even if a send failed part-way.
+            if posted:
                 self.bot.storage.save_update_notes_status(guild.id, status)
 
     @_poll_updates.before_loop
@@ -142,19 +188,63 @@ class UpdateNotesCog(commands.Cog):
         await self.bot.wait_until_ready()
 
     async def _fetch_entries(self) -> List[PatchNotesEntry]:
-        html = await self._fetch_url(GAME_UPDATE_NOTES_PAGE_URL)
-        if html is None:
+        if await self._page_unchanged():
+            return list(self._page_entries)
+
+        headers: Dict[str, str] = {}
+        if self._page_entries:
+            if self._page_etag:
+                headers["If-None-Match"] = self._page_etag
+            if self._page_last_modified:
+                headers["If-Modified-Since"] = self._page_last_modified
+
+        response = await self._fetch_response(GAME_UPDATE_NOTES_PAGE_URL, headers=headers)
+        if response is None:
             LOGGER.warning("Failed to fetch Guild Wars 2 game update notes page")
             return []
+        if response.status_code == 304:
+            return list(self._page_entries)
 
-        soup = BeautifulSoup(html, "html.parser")
-        content = soup.select_one("#mw-content-text")
+        entries = await asyncio.to_thread(
+            self._parse_entries, response.content, response.encoding
+        )
+        self._page_etag = response.headers.get("ETag")
+        self._page_last_modified = response.headers.get("Last-Modified")
+        self._page_entries = list(entries)
+        return entries
+
+    async def _page_unchanged(self) -> bool:
+        """Cheaply check whether the page still matches the cached entries."""
+
+        if not self._page_entries or not self._page_last_modified:
+            return False
+        try:
+            response = await asyncio.to_thread(
+                self._session.head,
+                GAME_UPDATE_NOTES_PAGE_URL,
+                allow_redirects=True,
+                timeout=30,
+            )
+        except requests.RequestException:
+            LOGGER.debug("HEAD request for game update notes page failed", exc_info=True)
+            return False
+        if not response.ok:
+            return False
+        return response.headers.get("Last-Modified") == self._page_last_modified
+
+    def _parse_entries(
+        self, markup: Union[bytes, str], encoding: Optional[str] = None
+    ) -> List[PatchNotesEntry]:
+        soup = BeautifulSoup(
+            markup, "lxml", parse_only=CONTENT_STRAINER, from_encoding=encoding
+        )
+        content = soup.find(id="mw-content-text")
         if content is None:
             LOGGER.warning("Unable to locate game update notes content wrapper")
             return []
 
         entries: List[PatchNotesEntry] = []
-        for heading in content.select("h2"):
+        for heading in content.find_all("h2"):
             entry = self._parse_page_entry(heading)
             if entry:
                 entries.append(entry)
@@ -182,11 +272,14 @@ class UpdateNotesCog(commands.Cog):
 
         entry_id = anchor
         url = f"{GAME_UPDATE_NOTES_PAGE_URL}#{anchor}"
-        published_at = self._parse_heading_timestamp(title)
+        published_dt = self._parse_heading_timestamp(title)
+        published_at = published_dt.isoformat() if published_dt else None
 
         section_elements = []
-        for sibling in heading.find_next_siblings():
-            if getattr(sibling, "name", None) == "h2":
+        for sibling in heading.next_siblings:
+            if not isinstance(sibling, Tag):
+                continue
+            if sibling.name == "h2":
                 break
             section_elements.append(sibling)
 
@@ -194,13 +287,15 @@ class UpdateNotesCog(commands.Cog):
             summary = "New Guild Wars 2 game update notes are available."
             content_markdown = summary
         else:
-            fragment = BeautifulSoup(
-                "<div>" + "".join(str(el) for el in section_elements) + "</div>",
-                "html.parser",
-            )
-            for unwanted in fragment.select("span.mw-editsection"):
+            # Move the already-parsed section nodes under a fresh wrapper
+            # rather than serialising and re-parsing them.
+            fragment = BeautifulSoup("", "lxml")
+            wrapper = fragment.new_tag("div")
+            wrapper.extend(section_elements)
+            fragment.append(wrapper)
+            for unwanted in fragment.find_all("span", class_="mw-editsection"):
                 unwanted.decompose()
-            for link in fragment.select("a[href]"):
+            for link in fragment.find_all("a", href=True):
                 href = link.get("href", "")
                 if href.startswith("/wiki/"):
                     link["href"] = f"https://wiki.guildwars2.com{href}"
@@ -218,10 +313,11 @@ class UpdateNotesCog(commands.Cog):
             summary=summary,
             content=content_markdown,
             legacy_entry_ids=(url,),
+            published_dt=published_dt,
         )
 
-    def _parse_heading_timestamp(self, title: str) -> Optional[str]:
-        match = re.search(r"([A-Za-z]+ \d{1,2}, \d{4})", title)
+    def _parse_heading_timestamp(self, title: str) -> Optional[datetime]:
+        match = _HEADING_DATE_RE.search(title)
         if not match:
             return None
         date_text = match.group(1)
@@ -230,8 +326,7 @@ class UpdateNotesCog(commands.Cog):
         except ValueError:
             LOGGER.debug("Unable to parse heading date: %s", title)
             return None
-        parsed = parsed.replace(tzinfo=timezone.utc)
-        return parsed.isoformat()
+        return parsed.replace(tzinfo=timezone.utc)
 
     def _resolve_new_entries(
         self,
@@ -242,22 +337,23 @@ class UpdateNotesCog(commands.Cog):
         if not entries:
             return []
 
-        collected: List[PatchNotesEntry] = []
         cutoff = self._parse_timestamp(last_entry_published_at)
-        for entry in entries:
+        stop = len(entries)
+        for index, entry in enumerate(entries):
             if last_entry_id and (
                 entry.entry_id == last_entry_id
                 or last_entry_id in entry.legacy_entry_ids
             ):
+                stop = index
                 break
 
-            entry_timestamp = self._parse_timestamp(entry.published_at)
-            if cutoff and entry_timestamp and entry_timestamp <= cutoff:
+            if cutoff and entry.published_dt and entry.published_dt <= cutoff:
+                stop = index
                 break
 
-            collected.append(entry)
-
-        return list(reversed(collected))
+        if not stop:
+            return []
+        return list(reversed(entries[:stop]))
 
     async def _resolve_channel(
         self, guild: discord.Guild, channel_id: int
@@ -291,29 +387,31 @@ class UpdateNotesCog(commands.Cog):
             or entry.summary
             or "New Guild Wars 2 game update notes are available."
         )
-        truncated_description = self._truncate(description, 4000)
+        was_truncated = len(description) > EMBED_DESCRIPTION_LIMIT
+        truncated_description = truncate_embed_field(description, EMBED_DESCRIPTION_LIMIT)
         if not truncated_description:
             truncated_description = "New Guild Wars 2 game update notes are available."
 
         embeds: List[discord.Embed] = []
-        parsed_timestamp = self._parse_timestamp(entry.published_at)
         embed = discord.Embed(
             title=entry.title,
             url=entry.url,
             description=truncated_description,
             color=self.EMBED_COLOR,
         )
-        if parsed_timestamp:
-            embed.timestamp = parsed_timestamp
+        if entry.published_dt:
+            embed.timestamp = entry.published_dt
         embed.set_thumbnail(url=EMBED_THUMBNAIL_URL)
-        if truncated_description != description:
+        if was_truncated:
             embed.set_footer(text="Guild Wars 2 Wiki – Game Updates (truncated)")
         else:
             embed.set_footer(text="Guild Wars 2 Wiki – Game Updates")
         embeds.append(embed)
         return embeds
 
-    def _parse_timestamp(self, value: Optional[str]) -> Optional[datetime]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
         if not value:
             return None
         candidate = value
@@ -328,29 +426,32 @@ class UpdateNotesCog(commands.Cog):
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
 
-    def _truncate(self, value: str, limit: int) -> str:
-        if len(value) <= limit:
-            return value
-        return value[: limit - 1].rstrip() + "…"
-
     def _render_comment_content(self, content) -> str:
-        for element in content.select("script, style"):
+        for element in content.find_all(["script", "style"]):
             element.decompose()
 
-        markdown = html_to_markdown(
-            str(content), heading_style="ATX", bullets="-*+", strip=["img"]
+        converter = MarkdownConverter(
+            heading_style="ATX", bullets="-*+", strip=["img"]
         )
-        return clean_markdown(markdown)
+        return clean_markdown(converter.convert_soup(content))
 
 
-    async def _fetch_url(self, url: str, retries: int = 3) -> Optional[str]:
+    async def _fetch_response(
+        self,
+        url: str,
+        retries: int = 3,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[requests.Response]:
         last_error: Optional[BaseException] = None
         for attempt in range(retries):
             try:
-                response = await asyncio.to_thread(self._session.get, url, timeout=30)
+                response = await asyncio.to_thread(
+                    self._session.get, url, headers=headers, timeout=30
+                )
                 response.raise_for_status()
                 response.encoding = response.encoding or "utf-8"
-                return response.text
+                return response
             except requests.RequestException as error:
                 last_error = error
                 LOGGER.warning(
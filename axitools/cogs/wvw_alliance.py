@@ -1,15 +1,21 @@
 """Alliance guild WvW matchup reporting."""
 from __future__ import annotations
 
+import asyncio
 import calendar
 import csv
 import io
 import logging
+import random
 import re
 import unicodedata
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
-from typing import Dict, List, Optional, Sequence
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
@@ -41,8 +47,23 @@ PST = ZoneInfo("America/Los_Angeles")
 PREDICTION_TIME = time(9, 0)
 RESET_TIME = time(19, 30)
 CHECK_INTERVAL_MINUTES = 5
+SHEET_CACHE_TTL = timedelta(hours=6)
+# Empty rosters (a failed download with nothing cached) are retried sooner.
+SHEET_EMPTY_CACHE_TTL = timedelta(minutes=5)
+MATCHES_CACHE_TTL = timedelta(minutes=5)
+GUILD_WORLD_CACHE_TTL = timedelta(hours=1)
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+REQUEST_RETRIES = 3
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY = 30.0
 DEFAULT_POST_DAY = 4
 TIME_OPTION_MINUTES = tuple(range(0, 60, 5))
+_DAY_NAMES = tuple(calendar.day_name)
+# Select options are stored as (label, value) pairs; each view still builds its
+# own SelectOption objects because ``sync`` toggles ``default`` per view.
+_DAY_OPTIONS = tuple((name, str(index)) for index, name in enumerate(_DAY_NAMES))
+_HOUR_OPTIONS = tuple((f"{hour:02d}", str(hour)) for hour in range(24))
+_MINUTE_OPTIONS = tuple((f"{minute:02d}", str(minute)) for minute in TIME_OPTION_MINUTES)
 
 COLOR_EMOJI = {
     "green": "🟢",
@@ -67,12 +88,61 @@ class TierPrediction:
     teams: Sequence[MatchTeam]
 
 
+@dataclass(frozen=True)
+class PosterSchedule:
+    prediction_day: int
+    prediction_time: time
+    current_day: int
+    current_time: time
+
+
 @dataclass(frozen=True)
 class AllianceRoster:
     alliances: List[tuple[str, List[str]]]
     solo_guilds: List[str]
 
 
+_EMPTY_ROSTER = AllianceRoster(alliances=[], solo_guilds=[])
+_NON_ALPHA_ASCII_RE = re.compile(r"[^A-Za-z\s]+")
+
+
+@lru_cache(maxsize=1024)
+def _normalized_text(value: str) -> str:
+    if value.isascii():
+        return " ".join(_NON_ALPHA_ASCII_RE.sub("", value).split()).casefold()
+    normalized = unicodedata.normalize("NFKD", value)
+    filtered = "".join(char for char in normalized if char.isalpha() or char.isspace())
+    return " ".join(filtered.split()).casefold()
+
+
+def _is_solo_header(value: str) -> bool:
+    return _normalized_text(value) == "solo guilds"
+
+
+@lru_cache(maxsize=128)
+def _format_world_names(world_ids: tuple[int, ...]) -> str:
+    names = [name for name in map(WVW_SERVER_NAMES.get, world_ids) if name]
+    return ", ".join(names) if names else "Unknown world"
+
+
+def _coerce_world_id(value: object) -> Optional[int]:
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return None
+
+
+def _match_section(match: dict, fallback: object, key: str) -> dict:
+    value = match.get(key)
+    if isinstance(value, dict) and value:
+        return value
+    if isinstance(fallback, dict):
+        value = fallback.get(key)
+        if isinstance(value, dict):
+            return value
+    return {}
+
+
 class AllianceScheduleView(discord.ui.View):
     def __init__(self, cog: "AllianceMatchupCog", guild: discord.Guild, config: GuildConfig) -> None:
         super().__init__(timeout=300)
@@ -102,12 +172,23 @@ class AllianceScheduleView(discord.ui.View):
             fallback,
         )
 
+    def _resolve_schedule(self) -> Dict[str, tuple[int, time]]:
+        cog = self.cog
+        config = self.config
+        return {
+            "prediction": (
+                cog._resolve_post_day(config.alliance_prediction_day, DEFAULT_POST_DAY),
+                cog._resolve_post_time(config.alliance_prediction_time, PREDICTION_TIME),
+            ),
+            "current": (
+                cog._resolve_post_day(config.alliance_current_day, DEFAULT_POST_DAY),
+                cog._resolve_post_time(config.alliance_current_time, RESET_TIME),
+            ),
+        }
+
     def sync_selects(self) -> None:
-        current_day = self.cog._resolve_post_day(
-            getattr(self.config, f"alliance_{self.active_target}_day"),
-            DEFAULT_POST_DAY,
-        )
-        current_time = self._current_time()
+        self._schedule = self._resolve_schedule()
+        current_day, current_time = self._schedule[self.active_target]
         self.target_select.sync(current=self.active_target)
         self.day_select.sync(current_day=current_day)
         self.hour_select.sync(current_hour=current_time.hour)
@@ -116,14 +197,15 @@ class AllianceScheduleView(discord.ui.View):
     def reset_last_post(self, *, target: str) -> None:
         if target == "prediction":
             self.config.alliance_last_prediction_at = None
+            self.config.alliance_last_prediction_date = None
         else:
             self.config.alliance_last_actual_at = None
+            self.config.alliance_last_actual_date = None
 
     def build_message(self) -> str:
-        prediction_day = self.cog._resolve_post_day(self.config.alliance_prediction_day, DEFAULT_POST_DAY)
-        current_day = self.cog._resolve_post_day(self.config.alliance_current_day, DEFAULT_POST_DAY)
-        prediction_time = self.cog._resolve_post_time(self.config.alliance_prediction_time, PREDICTION_TIME)
-        current_time = self.cog._resolve_post_time(self.config.alliance_current_time, RESET_TIME)
+        """Render the schedule summary resolved by the last :meth:`sync_selects`."""
+        prediction_day, prediction_time = self._schedule["prediction"]
+        current_day, current_time = self._schedule["current"]
         return (
             "Use the dropdowns below to configure when alliance matchup posts are sent.\n"
             f"**Prediction:** {self.cog._format_day(prediction_day)} at "
@@ -169,7 +251,7 @@ class _AllianceTargetSelect(discord.ui.Select):
 class _AllianceDaySelect(discord.ui.Select):
     def __init__(self, view: AllianceScheduleView, *, row: int) -> None:
         self.schedule_view = view
-        options = [discord.SelectOption(label=calendar.day_name[index], value=str(index)) for index in range(7)]
+        options = [discord.SelectOption(label=label, value=value) for label, value in _DAY_OPTIONS]
         super().__init__(
             placeholder="Select day",
             min_values=1,
@@ -179,7 +261,7 @@ class _AllianceDaySelect(discord.ui.Select):
         )
 
     def sync(self, *, current_day: int) -> None:
-        self.placeholder = calendar.day_name[current_day]
+        self.placeholder = _DAY_NAMES[current_day]
         for option in self.options:
             option.default = option.value == str(current_day)
 
@@ -198,7 +280,7 @@ class _AllianceDaySelect(discord.ui.Select):
 class _AllianceHourSelect(discord.ui.Select):
     def __init__(self, view: AllianceScheduleView, *, row: int) -> None:
         self.schedule_view = view
-        options = [discord.SelectOption(label=f"{hour:02d}", value=str(hour)) for hour in range(24)]
+        options = [discord.SelectOption(label=label, value=value) for label, value in _HOUR_OPTIONS]
         super().__init__(
             placeholder="Select hour",
             min_values=1,
@@ -233,10 +315,7 @@ class _AllianceHourSelect(discord.ui.Select):
 class _AllianceMinuteSelect(discord.ui.Select):
     def __init__(self, view: AllianceScheduleView, *, row: int) -> None:
         self.schedule_view = view
-        options = [
-            discord.SelectOption(label=f"{minute:02d}", value=str(minute))
-            for minute in TIME_OPTION_MINUTES
-        ]
+        options = [discord.SelectOption(label=label, value=value) for label, value in _MINUTE_OPTIONS]
         super().__init__(
             placeholder="Select minute",
             min_values=1,
@@ -286,6 +365,12 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         self._guild_world_cache: Dict[str, Dict[str, int]] = {}
         self._guild_world_cache_at: Dict[str, datetime] = {}
         self._sheet_cache: Dict[str, AllianceRoster] = {}
+        self._sheet_cache_at: Dict[str, datetime] = {}
+        self._sheet_cache_loaded = False
+        self._sheet_locks: Dict[str, asyncio.Lock] = {}
+        self._matches_cache: List[dict] = []
+        self._matches_cache_at: Optional[datetime] = None
+        self._schedule_cache: Dict[int, tuple[tuple[object, ...], PosterSchedule]] = {}
         self._poster_loop.start()
 
     async def cog_unload(self) -> None:  # pragma: no cover - discord.py lifecycle
@@ -295,33 +380,70 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if not self._session or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=HTTP_TIMEOUT,
                 headers={
                     "User-Agent": "Mozilla/5.0",
                     "Referer": "https://gw2mists.com/",
-                }
+                },
             )
         return self._session
 
     async def _fetch_json(self, url: str, *, params: Optional[Dict[str, str]] = None) -> object:
-        session = await self._get_session()
-        try:
-            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                response.raise_for_status()
-                return await response.json(content_type=None)
-        except aiohttp.ClientError as exc:
-            raise ValueError(f"Request failed: {exc}") from exc
+        return await self._request(url, params=params, as_json=True)
 
     async def _fetch_text(self, url: str, *, params: Optional[Dict[str, str]] = None) -> str:
+        return await self._request(url, params=params, as_json=False)
+
+    async def _request(self, url: str, *, params: Optional[Dict[str, str]], as_json: bool) -> object:
         session = await self._get_session()
+        for attempt in range(REQUEST_RETRIES):
+            final_attempt = attempt + 1 == REQUEST_RETRIES
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status not in RETRYABLE_STATUSES or final_attempt:
+                        response.raise_for_status()
+                        if as_json:
+                            return await response.json(content_type=None)
+                        return await response.text()
+                    reason = f"status {response.status}"
+                    delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                reason = str(exc) or type(exc).__name__
+                if final_attempt:
+                    raise ValueError(f"Request failed: {reason}") from exc
+                delay = self._retry_delay(None, attempt)
+            except aiohttp.ClientError as exc:
+                raise ValueError(f"Request failed: {exc}") from exc
+            LOGGER.warning(
+                "Request to %s failed (%s); retrying in %.1fs (attempt %s/%s)",
+                url,
+                reason,
+                delay,
+                attempt + 1,
+                REQUEST_RETRIES,
+            )
+            await asyncio.sleep(delay)
+        raise ValueError(f"Request failed: {url}")
+
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
         try:
-            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                response.raise_for_status()
-                return await response.text()
-        except aiohttp.ClientError as exc:
-            raise ValueError(f"Request failed: {exc}") from exc
+            base = float(retry_after) if retry_after else float(2**attempt)
+        except ValueError:
+            base = float(2**attempt)
+        return min(MAX_RETRY_DELAY, max(0.0, base)) + random.uniform(0, 1)
 
-    def _parse_timestamp(self, value: Optional[str]) -> Optional[datetime]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
         if not value:
             return None
         try:
@@ -332,7 +454,9 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         except ValueError:
             return None
 
-    def _parse_hhmm(self, value: Optional[str]) -> Optional[time]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_hhmm(value: Optional[str]) -> Optional[time]:
         if not value:
             return None
         cleaned = value.strip()
@@ -363,7 +487,7 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         return fallback
 
     def _format_day(self, value: int) -> str:
-        return calendar.day_name[value] if 0 <= value <= 6 else "Unknown"
+        return _DAY_NAMES[value] if 0 <= value <= 6 else "Unknown"
 
     async def _lookup_guild(self, name: str) -> Optional[tuple[str, str]]:
         try:
@@ -378,10 +502,14 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
 
         normalized_name = name.strip().casefold()
         best_match: Optional[tuple[str, str]] = None
-        for guild_id in candidate_ids:
-            try:
-                details = await self._fetch_json(GW2_GUILD_INFO_URL.format(guild_id=guild_id))
-            except ValueError:
+        responses = await asyncio.gather(
+            *(self._fetch_json(GW2_GUILD_INFO_URL.format(guild_id=guild_id)) for guild_id in candidate_ids),
+            return_exceptions=True,
+        )
+        for guild_id, details in zip(candidate_ids, responses):
+            if isinstance(details, BaseException):
+                if not isinstance(details, ValueError):
+                    raise details
                 continue
             if not isinstance(details, dict):
                 continue
@@ -401,22 +529,18 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         cached = self._guild_world_cache.get(url)
         cached_at = self._guild_world_cache_at.get(url)
         if not force_refresh and cached and cached_at:
-            if (now - cached_at).total_seconds() < 3600:
+            if now - cached_at < GUILD_WORLD_CACHE_TTL:
                 return cached
-        mapped: Dict[str, int] = {}
         payload = await self._fetch_json(url)
         if not isinstance(payload, dict):
             raise ValueError("Unexpected response from GW2 guild WvW endpoint")
-        for guild_id, world_id in payload.items():
-            if not isinstance(guild_id, str):
-                continue
-            normalized = normalise_guild_id(guild_id)
-            if not normalized:
-                continue
-            try:
-                mapped[normalized] = int(world_id)
-            except (TypeError, ValueError):
-                continue
+        mapped: Dict[str, int] = {
+            normalized: world
+            for guild_id, world_id in payload.items()
+            if isinstance(guild_id, str)
+            and (normalized := normalise_guild_id(guild_id))
+            and (world := _coerce_world_id(world_id)) is not None
+        }
         self._guild_world_cache[url] = mapped
         self._guild_world_cache_at[url] = now
         return mapped
@@ -448,6 +572,9 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         return 0
 
     async def _fetch_matches(self) -> List[dict]:
+        now = datetime.now(timezone.utc)
+        if self._matches_cache_at and now - self._matches_cache_at < MATCHES_CACHE_TTL:
+            return list(self._matches_cache)
         payload = await self._fetch_json(GW2_MATCHES_URL, params={"ids": ",".join(WVW_MATCHES)})
         if not isinstance(payload, list):
             raise ValueError("Unexpected response from GW2 matches endpoint")
@@ -457,7 +584,9 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
                 continue
             match["tier"] = self._resolve_tier(match)
             matches.append(match)
-        return matches
+        self._matches_cache = matches
+        self._matches_cache_at = now
+        return list(matches)
 
     async def _fetch_match_for_world(self, world_id: int) -> Optional[dict]:
         payload = await self._fetch_json(GW2_MATCHES_URL, params={"world": str(world_id)})
@@ -467,13 +596,9 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         return payload
 
     def _extract_match_teams(self, match: dict) -> List[MatchTeam]:
-        data = match.get("data") if isinstance(match.get("data"), dict) else {}
-        worlds = match.get("all_worlds") if isinstance(match.get("all_worlds"), dict) else {}
-        victory_points = match.get("victory_points") if isinstance(match.get("victory_points"), dict) else {}
-        if not worlds:
-            worlds = data.get("all_worlds") if isinstance(data.get("all_worlds"), dict) else {}
-        if not victory_points:
-            victory_points = data.get("victory_points") if isinstance(data.get("victory_points"), dict) else {}
+        data = match.get("data")
+        worlds = _match_section(match, data, "all_worlds")
+        victory_points = _match_section(match, data, "victory_points")
 
         teams: List[MatchTeam] = []
         for color in ("green", "blue", "red"):
@@ -487,67 +612,150 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         return teams
 
     def _predict_tiers(self, matches: List[dict]) -> List[TierPrediction]:
-        tiers: Dict[int, List[MatchTeam]] = {}
-        max_tier = max((match.get("tier", 0) for match in matches if isinstance(match.get("tier"), int)), default=0)
+        tiers: defaultdict[int, List[MatchTeam]] = defaultdict(list)
+        rows: List[tuple[int, MatchTeam, MatchTeam, MatchTeam]] = []
+        max_tier = 0
 
         for match in matches:
             tier = match.get("tier")
             if not isinstance(tier, int):
                 continue
+            max_tier = max(max_tier, tier)
             teams = self._extract_match_teams(match)
             if len(teams) != 3:
                 continue
-            ranked = sorted(teams, key=lambda team: team.victory_points, reverse=True)
-            winner, middle, loser = ranked
+            teams.sort(key=lambda team: -team.victory_points)
+            rows.append((tier, *teams))
 
+        for tier, winner, middle, loser in rows:
             winner_tier = tier if tier == 1 else tier - 1
             winner_color = "green" if tier == 1 else "red"
-            tiers.setdefault(winner_tier, []).append(
+            tiers[winner_tier].append(
                 MatchTeam(color=winner_color, world_ids=winner.world_ids, victory_points=winner.victory_points)
             )
 
-            tiers.setdefault(tier, []).append(
+            tiers[tier].append(
                 MatchTeam(color="blue", world_ids=middle.world_ids, victory_points=middle.victory_points)
             )
 
             loser_tier = tier if tier == max_tier else tier + 1
             loser_color = "red" if tier == max_tier else "green"
-            tiers.setdefault(loser_tier, []).append(
+            tiers[loser_tier].append(
                 MatchTeam(color=loser_color, world_ids=loser.world_ids, victory_points=loser.victory_points)
             )
 
         predictions: List[TierPrediction] = []
         color_order = {"green": 0, "blue": 1, "red": 2}
-        for tier, team_list in tiers.items():
-            ordered = sorted(team_list, key=lambda team: color_order.get(team.color, 99))
-            if ordered:
-                predictions.append(TierPrediction(tier=tier, teams=ordered))
-        return sorted(predictions, key=lambda item: item.tier)
+        for tier in sorted(tiers):
+            ordered = sorted(tiers[tier], key=lambda team: color_order.get(team.color, 99))
+            predictions.append(TierPrediction(tier=tier, teams=ordered))
+        return predictions
+
+    def _load_sheet_cache(self) -> None:
+        if self._sheet_cache_loaded:
+            return
+        self._sheet_cache_loaded = True
+        payload = self.bot.storage.get_alliance_sheet_cache()
+        if not isinstance(payload, dict):
+            return
+        for sheet_name, entry in payload.items():
+            if not isinstance(sheet_name, str) or not isinstance(entry, dict):
+                continue
+            fetched_at = self._parse_timestamp(entry.get("fetched_at"))
+            if not fetched_at:
+                continue
+            alliances: List[tuple[str, List[str]]] = []
+            for item in entry.get("alliances") or []:
+                if (
+                    isinstance(item, list)
+                    and len(item) == 2
+                    and isinstance(item[0], str)
+                    and isinstance(item[1], list)
+                ):
+                    alliances.append((item[0], [guild for guild in item[1] if isinstance(guild, str)]))
+            solo_guilds = [guild for guild in entry.get("solo_guilds") or [] if isinstance(guild, str)]
+            self._sheet_cache[sheet_name] = AllianceRoster(alliances=alliances, solo_guilds=solo_guilds)
+            self._sheet_cache_at[sheet_name] = fetched_at
+
+    def _persist_sheet_cache(self) -> None:
+        payload = {
+            sheet_name: {
+                "fetched_at": self._sheet_cache_at[sheet_name].isoformat(),
+                "alliances": [[name, list(guilds)] for name, guilds in roster.alliances],
+                "solo_guilds": list(roster.solo_guilds),
+            }
+            for sheet_name, roster in self._sheet_cache.items()
+            if sheet_name in self._sheet_cache_at and (roster.alliances or roster.solo_guilds)
+        }
+        self.bot.storage.save_alliance_sheet_cache(payload)
+
+    def _fresh_sheet_roster(self, sheet_name: str) -> Optional[AllianceRoster]:
+        self._load_sheet_cache()
+        cached = self._sheet_cache.get(sheet_name)
+        cached_at = self._sheet_cache_at.get(sheet_name)
+        if cached is None or not cached_at:
+            return None
+        if datetime.now(timezone.utc) - cached_at < self._sheet_ttl(cached):
+            return cached
+        return None
+
+    @staticmethod
+    def _sheet_ttl(roster: AllianceRoster) -> timedelta:
+        return SHEET_CACHE_TTL if roster.alliances or roster.solo_guilds else SHEET_EMPTY_CACHE_TTL
+
+    def invalidate_sheet_cache(self, sheet_name: Optional[str] = None) -> None:
+        """Forget cached rosters, in memory and on disk, so the next use re-downloads them."""
+
+        self._load_sheet_cache()
+        if sheet_name is None:
+            self._sheet_cache.clear()
+            self._sheet_cache_at.clear()
+        else:
+            self._sheet_cache.pop(sheet_name, None)
+            self._sheet_cache_at.pop(sheet_name, None)
+        self._persist_sheet_cache()
 
     async def _fetch_alliances(self, sheet_name: str) -> AllianceRoster:
-        if sheet_name in self._sheet_cache:
-            return self._sheet_cache[sheet_name]
+        cached = self._fresh_sheet_roster(sheet_name)
+        if cached is not None:
+            return cached
+        # Concurrent callers for the same tab wait for a single download.
+        lock = self._sheet_locks.setdefault(sheet_name, asyncio.Lock())
+        async with lock:
+            cached = self._fresh_sheet_roster(sheet_name)
+            if cached is not None:
+                return cached
+            return await self._download_alliances(sheet_name)
+
+    async def _download_alliances(self, sheet_name: str) -> AllianceRoster:
+        now = datetime.now(timezone.utc)
+        cached = self._sheet_cache.get(sheet_name)
         try:
             text = await self._fetch_text(SHEET_URL, params={"tqx": "out:csv", "sheet": sheet_name})
         except ValueError:
+            if cached is not None:
+                # Keep serving the stale roster for a short window before trying the sheet again.
+                self._sheet_cache_at[sheet_name] = now - self._sheet_ttl(cached) + SHEET_EMPTY_CACHE_TTL
+                return cached
             roster = AllianceRoster(alliances=[], solo_guilds=[])
             self._sheet_cache[sheet_name] = roster
+            self._sheet_cache_at[sheet_name] = now
             return roster
 
+        roster = await asyncio.to_thread(self._parse_alliance_csv, text)
+        self._sheet_cache[sheet_name] = roster
+        self._sheet_cache_at[sheet_name] = now
+        self._persist_sheet_cache()
+        return roster
+
+    @staticmethod
+    def _parse_alliance_csv(text: str) -> AllianceRoster:
         reader = csv.reader(io.StringIO(text))
         rows = list(reader)
         alliances: List[tuple[str, List[str]]] = []
         solo_guilds: List[str] = []
         in_solo = False
 
-        def _normalized_text(value: str) -> str:
-            normalized = unicodedata.normalize("NFKD", value)
-            filtered = "".join(char for char in normalized if char.isalpha() or char.isspace())
-            return " ".join(filtered.split()).casefold()
-
-        def _is_solo_header(value: str) -> bool:
-            return _normalized_text(value) == "solo guilds"
-
         for row in rows[1:]:
             first = row[0].strip() if len(row) > 0 and row[0] else ""
             second = row[1].strip() if len(row) > 1 and row[1] else ""
@@ -572,23 +780,28 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
                         guilds.append(cleaned)
             alliances.append((first, guilds))
 
-        roster = AllianceRoster(alliances=alliances, solo_guilds=solo_guilds)
-        self._sheet_cache[sheet_name] = roster
-        return roster
+        return AllianceRoster(alliances=alliances, solo_guilds=solo_guilds)
 
     async def _resolve_team_alliances(self, world_ids: Sequence[int]) -> AllianceRoster:
         alliance_map: Dict[str, List[str]] = {}
+        alliance_seen: Dict[str, set[str]] = {}
         solo_seen: set[str] = set()
         solo_guilds: List[str] = []
-        for world_id in world_ids:
-            sheet_name = WVW_ALLIANCE_SHEET_TABS.get(world_id)
-            if not sheet_name:
-                continue
-            roster = await self._fetch_alliances(sheet_name)
+        sheet_names = list(
+            dict.fromkeys(
+                sheet_name
+                for sheet_name in (WVW_ALLIANCE_SHEET_TABS.get(world_id) for world_id in world_ids)
+                if sheet_name
+            )
+        )
+        rosters = await asyncio.gather(*(self._fetch_alliances(name) for name in sheet_names))
+        for roster in rosters:
             for name, guilds in roster.alliances:
                 existing = alliance_map.setdefault(name, [])
+                seen = alliance_seen.setdefault(name, set())
                 for guild in guilds:
-                    if guild not in existing:
+                    if guild not in seen:
+                        seen.add(guild)
                         existing.append(guild)
             for guild in roster.solo_guilds:
                 if guild not in solo_seen:
@@ -643,8 +856,11 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             return None
 
         matched_worlds: List[int] = []
-        for world_id, sheet_name in WVW_ALLIANCE_SHEET_TABS.items():
-            roster = await self._fetch_alliances(sheet_name)
+        sheet_tabs = list(WVW_ALLIANCE_SHEET_TABS.items())
+        rosters = await asyncio.gather(
+            *(self._fetch_alliances(sheet_name) for _, sheet_name in sheet_tabs)
+        )
+        for (world_id, _), roster in zip(sheet_tabs, rosters):
             all_guilds: List[str] = []
             for alliance_name, guilds in roster.alliances:
                 all_guilds.append(alliance_name)
@@ -662,12 +878,7 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         return matched_worlds[0]
 
     def _format_worlds(self, world_ids: Sequence[int]) -> str:
-        names: List[str] = []
-        for world_id in world_ids:
-            name = WVW_SERVER_NAMES.get(world_id)
-            if name:
-                names.append(name)
-        return ", ".join(names) if names else "Unknown world"
+        return _format_world_names(tuple(world_ids))
 
     def _format_alliance_list(self, roster: AllianceRoster) -> str:
         if not roster.alliances and not roster.solo_guilds:
@@ -688,19 +899,14 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
         lines = alliances_lines + solo_lines
         while lines and lines[-1] == "":
             lines.pop()
-        combined = "\n".join(lines)
-        if len(combined) <= 1000:
-            return combined
+        # Cumulative length of each line plus its newline; the first k lines
+        # joined are ``ends[k - 1] - 1`` characters long.
+        ends = list(accumulate(len(line) + 1 for line in lines))
+        if not ends or ends[-1] - 1 <= 1000:
+            return "\n".join(lines)
         max_length = 980
-        trimmed: List[str] = []
-        total = 0
-        for line in lines:
-            next_total = total + len(line) + (1 if trimmed else 0)
-            if next_total > max_length:
-                break
-            trimmed.append(line)
-            total = next_total
-        return "\n".join(trimmed) + "\n…"
+        keep = bisect_right(ends, max_length + 1)
+        return "\n".join(lines[:keep]) + "\n…"
 
     def _trim_field_value(self, value: str, max_length: int = 1024) -> str:
         if len(value) <= max_length:
@@ -795,17 +1001,17 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             emoji = COLOR_EMOJI.get(home_team.color, "")
             embed.add_field(name="Your team color", value=f"{emoji} {color_label}".strip(), inline=True)
         embed.add_field(name="Tier", value=f"Tier {tier}", inline=True)
-        embed.add_field(name="\u200b", value="\u200b", inline=False)
+        if not home_team:
+            # Three inline header fields already fill a row; only pad the
+            # two-field header so team rosters start on their own line.
+            embed.add_field(name="\u200b", value="\u200b", inline=False)
 
-        for team in teams:
+        opponents = [team for team in teams if home_world_id not in team.world_ids]
+        for team in opponents:
             world_label = self._format_worlds(team.world_ids)
-            is_home = home_world_id in team.world_ids
-            color_name = team.color.capitalize()
-            if is_home:
-                continue
             sheet_url = self._resolve_sheet_url(team.world_ids)
-            name = f"{COLOR_EMOJI.get(team.color, '')} {color_name} — {world_label}"
-            alliance_list = alliances.get(world_label, AllianceRoster(alliances=[], solo_guilds=[]))
+            name = f"{COLOR_EMOJI.get(team.color, '')} {team.color.capitalize()} — {world_label}"
+            alliance_list = alliances.get(world_label, _EMPTY_ROSTER)
             value = self._format_alliance_list(alliance_list)
             if sheet_url:
                 value = f"[source]({sheet_url})\n{value}"
@@ -814,16 +1020,14 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
 
         if confidence is not None:
             footer_parts = [f"Home: {confidence}%"]
-            for team in teams:
-                if home_world_id in team.world_ids:
-                    continue
+            remaining_swing = self._remaining_skirmish_swing() if confidence_map is None else 0
+            for team in opponents:
                 if confidence_map is not None:
                     opponent_confidence = next(
                         (confidence_map.get(wid) for wid in team.world_ids if wid in confidence_map),
                         None,
                     )
                 else:
-                    remaining_swing = self._remaining_skirmish_swing()
                     opponent_confidence = self._calculate_team_confidence(teams, team, remaining_swing)
                 if opponent_confidence is None:
                     continue
@@ -925,10 +1129,10 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             title = "Current WvW Matchup"
             confidence = None
 
-        alliances: Dict[str, AllianceRoster] = {}
-        for team in teams:
-            world_label = self._format_worlds(team.world_ids)
-            alliances[world_label] = await self._resolve_team_alliances(team.world_ids)
+        rosters = await asyncio.gather(*(self._resolve_team_alliances(team.world_ids) for team in teams))
+        alliances: Dict[str, AllianceRoster] = {
+            self._format_worlds(team.world_ids): roster for team, roster in zip(teams, rosters)
+        }
 
         embed = self._build_embed(
             title=title,
@@ -948,14 +1152,39 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             return False
 
         now_iso = utcnow()
+        posted_on = datetime.now(PST).date().isoformat()
         if prediction:
             config.alliance_last_prediction_at = now_iso
+            config.alliance_last_prediction_date = posted_on
         else:
             config.alliance_last_actual_at = now_iso
+            config.alliance_last_actual_date = posted_on
         self.bot.save_config(guild.id, config)
         return True
 
-    def _already_posted(self, timestamp: Optional[str], now: datetime) -> bool:
+    def _poster_schedule(self, guild_id: int, config: GuildConfig) -> PosterSchedule:
+        key = (
+            config.alliance_prediction_day,
+            config.alliance_prediction_time,
+            config.alliance_current_day,
+            config.alliance_current_time,
+        )
+        cached = self._schedule_cache.get(guild_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        schedule = PosterSchedule(
+            prediction_day=self._resolve_post_day(config.alliance_prediction_day, DEFAULT_POST_DAY),
+            prediction_time=self._resolve_post_time(config.alliance_prediction_time, PREDICTION_TIME),
+            current_day=self._resolve_post_day(config.alliance_current_day, DEFAULT_POST_DAY),
+            current_time=self._resolve_post_time(config.alliance_current_time, RESET_TIME),
+        )
+        self._schedule_cache[guild_id] = (key, schedule)
+        return schedule
+
+    def _already_posted(self, timestamp: Optional[str], now: datetime, posted_on: Optional[str] = None) -> bool:
+        if posted_on:
+            return posted_on == now.date().isoformat()
+        # Configs saved before the PST post date was stored only have the UTC timestamp.
         last_post = self._parse_timestamp(timestamp)
         if not last_post:
             return False
@@ -967,26 +1196,54 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             return
         now = datetime.now(PST)
         now_time = now.time().replace(second=0, microsecond=0)
+        weekday = now.weekday()
+        due: List[Tuple[discord.Guild, GuildConfig, bool, bool]] = []
         for guild in self.bot.guilds:
             config = self.bot.get_config(guild.id)
             if not config.alliance_channel_id or not config.alliance_guild_id:
                 continue
-            channel = await self._resolve_channel(guild, config.alliance_channel_id)
-            if not channel:
+            schedule = self._poster_schedule(guild.id, config)
+            post_prediction = (
+                weekday == schedule.prediction_day
+                and now_time >= schedule.prediction_time
+                and not self._already_posted(
+                    config.alliance_last_prediction_at, now, config.alliance_last_prediction_date
+                )
+            )
+            post_current = (
+                weekday == schedule.current_day
+                and now_time >= schedule.current_time
+                and not self._already_posted(config.alliance_last_actual_at, now, config.alliance_last_actual_date)
+            )
+            if not post_prediction and not post_current:
                 continue
-            prediction_time = self._resolve_post_time(config.alliance_prediction_time, PREDICTION_TIME)
-            current_time = self._resolve_post_time(config.alliance_current_time, RESET_TIME)
-            prediction_day = self._resolve_post_day(config.alliance_prediction_day, DEFAULT_POST_DAY)
-            current_day = self._resolve_post_day(config.alliance_current_day, DEFAULT_POST_DAY)
-            if now.weekday() == prediction_day:
-                if now_time >= prediction_time:
-                    if not self._already_posted(config.alliance_last_prediction_at, now):
-                        LOGGER.info("Posting alliance prediction matchup for guild %s", guild.id)
-                        await self._post_matchup(guild=guild, channel=channel, config=config, prediction=True)
-            if now.weekday() == current_day and now_time >= current_time:
-                if not self._already_posted(config.alliance_last_actual_at, now):
-                    LOGGER.info("Posting alliance current matchup for guild %s", guild.id)
-                    await self._post_matchup(guild=guild, channel=channel, config=config, prediction=False)
+            due.append((guild, config, post_prediction, post_current))
+        if not due:
+            return
+        results = await asyncio.gather(
+            *(self._post_due_matchups(*entry) for entry in due), return_exceptions=True
+        )
+        for (guild, *_), result in zip(due, results):
+            if isinstance(result, Exception):
+                LOGGER.error("Failed to post alliance matchup for guild %s", guild.id, exc_info=result)
+
+    async def _post_due_matchups(
+        self,
+        guild: discord.Guild,
+        config: GuildConfig,
+        post_prediction: bool,
+        post_current: bool,
+    ) -> None:
+        # Both posts share ``config``, so they stay sequential within a guild.
+        channel = await self._resolve_channel(guild, config.alliance_channel_id)
+        if not channel:
+            return
+        if post_prediction:
+            LOGGER.info("Posting alliance prediction matchup for guild %s", guild.id)
+            await self._post_matchup(guild=guild, channel=channel, config=config, prediction=True)
+        if post_current:
+            LOGGER.info("Posting alliance current matchup for guild %s", guild.id)
+            await self._post_matchup(guild=guild, channel=channel, config=config, prediction=False)
 
     @_poster_loop.before_loop
     async def _before_loop(self) -> None:  # pragma: no cover - discord.py lifecycle
@@ -1124,5 +1381,19 @@ class AllianceMatchupCog(commands.GroupCog, name="alliance"):
             )
 
 
+    @app_commands.command(
+        name="refreshsheets",
+        description="Clear cached alliance rosters so the sheet is downloaded again (admin only).",
+    )
+    async def refresh_sheets(self, interaction: discord.Interaction) -> None:
+        if not await self.bot.ensure_authorised(interaction):
+            return
+        self.invalidate_sheet_cache()
+        await interaction.response.send_message(
+            "Cleared cached alliance rosters. The sheet will be downloaded again on next use.",
+            ephemeral=True,
+        )
+
+
 async def setup(bot: AxiToolsBot) -> None:
     await bot.add_cog(AllianceMatchupCog(bot))
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 MEDIA_PATH = PACKAGE_ROOT.parent / "media"
 CLASS_ICON_PATH = MEDIA_PATH / "gw2classicons"
 
 
+@lru_cache(maxsize=None)
+def _class_icon_path(icon_file: str) -> Path:
+    return CLASS_ICON_PATH / icon_file
+
+
 @dataclass(frozen=True)
 class Profession:
     """Metadata for a Guild Wars 2 profession."""
@@ -20,7 +28,7 @@ class Profession:
 
     @property
     def icon_path(self) -> Path:
-        return CLASS_ICON_PATH / self.icon_file
+        return _class_icon_path(self.icon_file)
 
 
 @dataclass(frozen=True)
@@ -33,7 +41,7 @@ class Specialization:
 
     def icon_path(self, professions: Dict[str, Profession]) -> Path:
         if self.icon_file:
-            return CLASS_ICON_PATH / self.icon_file
+            return _class_icon_path(self.icon_file)
         return professions[self.profession].icon_path
 
 
@@ -99,53 +107,60 @@ SPECIALIZATIONS: Dict[str, Specialization] = {
 }
 
 # Convenience list that combines professions and specializations for command choices.
-CLASS_CHOICES = sorted(
-    list(PROFESSIONS.keys()) + list(SPECIALIZATIONS.keys())
-)
+CLASS_CHOICES: Tuple[str, ...] = tuple(sorted(chain(PROFESSIONS, SPECIALIZATIONS)))
+
+# Single lookup across both tables; professions take precedence on a name clash.
+CLASS_INDEX: Dict[str, Union[Profession, Specialization]] = {**SPECIALIZATIONS, **PROFESSIONS}
 
 # Manual Guild Wars 2 WvW server mapping (see reference settings list).
-WVW_SERVER_NAMES: Dict[int, str] = {
-    11001: "Moogooloo",
-    11002: "Rall's Rest",
-    11003: "Domain of Torment",
-    11004: "Yohlon Haven",
-    11005: "Tomb of Drascir",
-    11006: "Hall of Judgment",
-    11007: "Throne of Balthazar",
-    11008: "Dwayna's Temple",
-    11009: "Abaddon's Prison",
-    11010: "Cathedral of Blood",
-    11011: "Lutgardis Conservatory",
-    11012: "Mosswood",
-}
+WVW_SERVER_NAMES: Mapping[int, str] = MappingProxyType(
+    {
+        11001: "Moogooloo",
+        11002: "Rall's Rest",
+        11003: "Domain of Torment",
+        11004: "Yohlon Haven",
+        11005: "Tomb of Drascir",
+        11006: "Hall of Judgment",
+        11007: "Throne of Balthazar",
+        11008: "Dwayna's Temple",
+        11009: "Abaddon's Prison",
+        11010: "Cathedral of Blood",
+        11011: "Lutgardis Conservatory",
+        11012: "Mosswood",
+    }
+)
 
 # Alliance roster sheet tab names keyed by WvW world id.
-WVW_ALLIANCE_SHEET_TABS: Dict[int, str] = {
-    11001: "Moogooloo",
-    11002: "RR",
-    11003: "DoT",
-    11004: "YH",
-    11005: "ToD",
-    11006: "HoJ",
-    11007: "ThroB",
-    11008: "DT",
-    11009: "AP",
-    11010: "CoB",
-    11011: "LC",
-    11012: "Mosswood",
-}
+WVW_ALLIANCE_SHEET_TABS: Mapping[int, str] = MappingProxyType(
+    {
+        11001: "Moogooloo",
+        11002: "RR",
+        11003: "DoT",
+        11004: "YH",
+        11005: "ToD",
+        11006: "HoJ",
+        11007: "ThroB",
+        11008: "DT",
+        11009: "AP",
+        11010: "CoB",
+        11011: "LC",
+        11012: "Mosswood",
+    }
+)
 
-WVW_ALLIANCE_SHEET_GIDS: Dict[int, int] = {
-    11001: 658801507,  # Moogooloo
-    11002: 1974546691,  # Rall's Rest
-    11003: 1287523523,  # Domain of Torment
-    11004: 537207900,  # Yohlon Haven
-    11005: 1760357507,  # Tombs of Drascir
-    11006: 1872696628,  # Hall of Judgement
-    11007: 1770658789,  # Throne of Balthazar
-    11008: 990248232,  # Dwayna's Temple
-    11009: 0,  # Abbadon's Prison
-    11010: 950272983,  # Cathedral of Blood
-    11011: 2072324186,  # Lutgardis Conservatory
-    11012: 92543690,  # Mosswood
-}
+WVW_ALLIANCE_SHEET_GIDS: Mapping[int, int] = MappingProxyType(
+    {
+        11001: 658801507,  # Moogooloo
+        11002: 1974546691,  # Rall's Rest
+        11003: 1287523523,  # Domain of Torment
+        11004: 537207900,  # Yohlon Haven
+        11005: 1760357507,  # Tombs of Drascir
+        11006: 1872696628,  # Hall of Judgement
+        11007: 1770658789,  # Throne of Balthazar
+        11008: 990248232,  # Dwayna's Temple
+        11009: 0,  # Abbadon's Prison
+        11010: 950272983,  # Cathedral of Blood
+        11011: 2072324186,  # Lutgardis Conservatory
+        11012: 92543690,  # Mosswood
+    }
+)
@@ -5,7 +5,8 @@ import io
 import logging
 import gzip
 import zlib
-from typing import Iterable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 import aiohttp
 import brotli
@@ -14,22 +15,66 @@ import zstandard as zstd
 
 LOGGER = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 65536
+
+# A chunk decompressor paired with a check that the compressed stream ended cleanly.
+_StreamDecoder = Tuple[Callable[[bytes], bytes], Callable[[], bool]]
+
 
 async def read_response_text(response: aiohttp.ClientResponse) -> str:
     """Read an HTTP response and decode its payload respecting encodings."""
 
-    raw = await response.read()
-    encodings = [
-        encoding.strip().lower()
-        for encoding in response.headers.get("Content-Encoding", "").split(",")
-        if encoding.strip()
-    ]
+    encodings = _parse_content_encoding(response.headers.get("Content-Encoding", ""))
 
-    data = _decompress_chain(raw, encodings)
+    stream_factory = _STREAM_DECOMPRESSORS.get(encodings[0]) if len(encodings) == 1 else None
+    if stream_factory is not None:
+        data = await _read_streamed(response, encodings[0], stream_factory())
+    else:
+        raw = await response.read()
+        data = _decompress_chain(raw, encodings)
     charset = response.charset or "utf-8"
     return data.decode(charset, errors="replace")
 
 
+@lru_cache(maxsize=64)
+def _parse_content_encoding(header: str) -> Tuple[str, ...]:
+    """Split a ``Content-Encoding`` header into normalised encoding tokens."""
+
+    return tuple(token for token in (part.strip().lower() for part in header.split(",")) if token)
+
+
+async def _read_streamed(
+    response: aiohttp.ClientResponse,
+    encoding: str,
+    decoder: _StreamDecoder,
+) -> bytes:
+    """Decompress the body chunk by chunk instead of buffering it compressed.
+
+    If the stream cannot be decoded or ends before the compressed data does,
+    the raw body is run through :func:`_decompress_chain` like unstreamed reads.
+    """
+
+    decompress, finished = decoder
+    # Compressed chunks are kept, uncopied, in case the fallback needs them.
+    raw_chunks: List[bytes] = []
+    buffer = bytearray()
+    decoding = True
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+        raw_chunks.append(chunk)
+        if not decoding:
+            continue
+        try:
+            buffer += decompress(chunk)
+        except Exception:
+            LOGGER.debug("Streaming %s decompression failed", encoding, exc_info=True)
+            decoding = False
+    if decoding and finished():
+        return bytes(buffer)
+    if decoding:
+        LOGGER.debug("Streamed %s response did not end cleanly", encoding)
+    return _decompress_chain(b"".join(raw_chunks), (encoding,))
+
+
 def _decompress_chain(data: bytes, encodings: Iterable[str]) -> bytes:
     decompressed = data
     for encoding in encodings:
@@ -43,21 +88,60 @@ def _decompress_chain(data: bytes, encodings: Iterable[str]) -> bytes:
     return decompressed
 
 
-def _decompress_bytes(data: bytes, encoding: str) -> bytes:
-    if encoding == "gzip":
-        return gzip.decompress(data)
-    if encoding == "deflate":
-        try:
-            return zlib.decompress(data)
-        except zlib.error:
-            return zlib.decompress(data, -zlib.MAX_WBITS)
-    if encoding == "br":
-        return brotli.decompress(data)
-    if encoding in {"zstd", "zstandard"}:
-        decompressor = zstd.ZstdDecompressor()
-        with decompressor.stream_reader(io.BytesIO(data)) as reader:
+def _deflate_decompress(data: bytes) -> bytes:
+    try:
+        return zlib.decompress(data)
+    except zlib.error:
+        return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+_ZSTD = zstd.ZstdDecompressor()
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    try:
+        return _ZSTD.decompress(data)
+    except zstd.ZstdError:
+        # Streamed frames omit the content size, which one-shot decompression needs.
+        with _ZSTD.stream_reader(io.BytesIO(data)) as reader:
             return reader.read()
-    if encoding == "identity":
-        return data
-    raise ValueError(f"Unsupported content encoding: {encoding}")
 
+
+def _identity(data: bytes) -> bytes:
+    return data
+
+
+_DECOMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.decompress,
+    "deflate": _deflate_decompress,
+    "br": brotli.decompress,
+    "zstd": _zstd_decompress,
+    "zstandard": _zstd_decompress,
+    "identity": _identity,
+}
+
+
+def _eof_decoder(decoder: Any) -> _StreamDecoder:
+    # Trailing bytes after the end of the stream need the buffered path too.
+    return decoder.decompress, lambda: decoder.eof and not decoder.unused_data
+
+
+def _brotli_decoder() -> _StreamDecoder:
+    decoder = brotli.Decompressor()
+    return decoder.process, decoder.is_finished
+
+
+_STREAM_DECOMPRESSORS: Dict[str, Callable[[], _StreamDecoder]] = {
+    "gzip": lambda: _eof_decoder(zlib.decompressobj(16 + zlib.MAX_WBITS)),
+    "br": _brotli_decoder,
+    "zstd": lambda: _eof_decoder(_ZSTD.decompressobj()),
+    "zstandard": lambda: _eof_decoder(_ZSTD.decompressobj()),
+    "identity": lambda: (_identity, lambda: True),
+}
+
+
+def _decompress_bytes(data: bytes, encoding: str) -> bytes:
+    decompress = _DECOMPRESSORS.get(encoding)
+    if decompress is None:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    return decompress(data)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import re
 from html import unescape
+from itertools import groupby
 
 from markdownify import markdownify as html_to_markdown
 
@@ -21,17 +22,13 @@ def clean_html(text: str, *, max_length: int | None = None) -> str:
 
 def clean_markdown(text: str) -> str:
     """Collapse excessive blank lines and normalise bullet markers."""
-    lines = [line.rstrip() for line in text.splitlines()]
     cleaned: list[str] = []
-    blank = False
-    for line in lines:
-        if line.strip():
-            cleaned.append(line)
-            blank = False
+    lines = (line.rstrip() for line in text.splitlines())
+    for has_text, group in groupby(lines, key=bool):
+        if has_text:
+            cleaned.extend(group)
         else:
-            if not blank:
-                cleaned.append("")
-            blank = True
+            cleaned.append("")
     result = "\n".join(cleaned).strip()
     return ensure_bullet_prefix(result) if result else result
 
@@ -1,22 +1,36 @@
 """Persistent storage utilities for the AxiTools bot."""
 from __future__ import annotations
 
-import json
+import asyncio
+import copy
 import logging
+import mmap
+import os
 import sqlite3
+import threading
 import unicodedata
 import uuid
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, astuple, dataclass, field, fields, replace
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-import re
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import orjson
 
 
 logger = logging.getLogger(__name__)
 
 
 ISOFORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+PRODUCTION = os.getenv("PRODUCTION", "true").lower() in {"1", "true", "yes", "on"}
+# Production writes compact JSON; development keeps files indented for inspection.
+JSON_WRITE_OPTIONS = orjson.OPT_NON_STR_KEYS | (0 if PRODUCTION else orjson.OPT_INDENT_2)
+WRITE_FLUSH_DELAY = 0.1
+WRITE_RETRY_DELAY = 30.0
+MMAP_READ_THRESHOLD = 4096
 
 ZERO_WIDTH_CHARS = {
     "\u200b",  # zero width space
@@ -33,30 +47,38 @@ ZERO_WIDTH_CHARS = {
     "\ufeff",  # zero width no-break space / BOM
 }
 ZERO_WIDTH_TRANSLATION = {ord(char): None for char in ZERO_WIDTH_CHARS}
+# Every Cc code point sits below U+00A0; non-breaking spaces become plain spaces.
+_TIMEZONE_TRANSLATION = {
+    **ZERO_WIDTH_TRANSLATION,
+    **{codepoint: None for codepoint in range(0xA0) if unicodedata.category(chr(codepoint)) == "Cc"},
+    0x00A0: " ",
+    0x202F: " ",
+}
 
 
-_GUILD_ID_ALLOWED = re.compile(r"[a-f0-9-]+")
+_GUILD_ID_DELETE = bytes(byte for byte in range(256) if byte not in b"0123456789abcdef-")
 
 
 def normalise_timezone(value: str) -> str:
     """Return a cleaned timezone string suitable for IANA lookup."""
 
-    if value is None:
-        cleaned = ""
-    else:
-        cleaned = str(value)
+    # Coerce before the cached lookup so unhashable payload values still work
+    return _normalise_timezone_text("" if value is None else str(value))
 
-    # Remove zero width characters that sneak through Discord inputs
-    if ZERO_WIDTH_TRANSLATION:
-        cleaned = cleaned.translate(ZERO_WIDTH_TRANSLATION)
 
-    # Drop any remaining control / format characters that break ZoneInfo lookup
-    cleaned = "".join(
-        ch for ch in cleaned if unicodedata.category(ch) not in {"Cf", "Cc"}
-    )
+@lru_cache(maxsize=4096)
+def _normalise_timezone_text(cleaned: str) -> str:
+    """Clean an already-stringified timezone value (memoised)."""
 
-    # Replace non-breaking spaces with normal spaces so stripping works reliably
-    cleaned = cleaned.replace("\u00a0", " ").replace("\u202f", " ")
+    # Remove zero width and control characters that sneak through Discord inputs,
+    # and turn non-breaking spaces into normal spaces so stripping works reliably
+    cleaned = cleaned.translate(_TIMEZONE_TRANSLATION)
+
+    # Drop any remaining format characters that break ZoneInfo lookup
+    if not cleaned.isascii():
+        cleaned = "".join(
+            ch for ch in cleaned if unicodedata.category(ch) not in {"Cf", "Cc"}
+        )
 
     cleaned = cleaned.strip()
     if "  " in cleaned:
@@ -69,19 +91,24 @@ def normalise_timezone(value: str) -> str:
 def utcnow() -> str:
     """Return the current UTC timestamp formatted for storage."""
 
-    return datetime.now(timezone.utc).strftime(ISOFORMAT)
+    now = datetime.now(timezone.utc)
+    # Equivalent to ``now.strftime(ISOFORMAT)`` without the strftime overhead.
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}T"
+        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}.{now.microsecond:06d}Z"
+    )
 
 
+@lru_cache(maxsize=4096)
 def normalise_guild_id(guild_id: str) -> str:
     """Return a canonical Guild Wars 2 guild ID for matching and persistence."""
 
     cleaned = guild_id.strip().lower()
     # Strip any invisible or non-hex characters to avoid mismatches from pasted values
-    cleaned = "".join(_GUILD_ID_ALLOWED.findall(cleaned))
-    return cleaned
+    return cleaned.encode("ascii", "ignore").translate(None, _GUILD_ID_DELETE).decode("ascii")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompClassConfig:
     """Configuration for an individual class within a scheduled composition."""
 
@@ -90,7 +117,7 @@ class CompClassConfig:
     emoji_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompConfig:
     """Composition scheduling and signup configuration."""
 
@@ -203,7 +230,7 @@ class CompConfig:
         return CompConfig.from_dict(payload)
 
 
-@dataclass
+@dataclass(slots=True)
 class GuildConfig:
     """Server-specific configuration."""
 
@@ -223,6 +250,8 @@ class GuildConfig:
     alliance_server_name: Optional[str] = None
     alliance_last_prediction_at: Optional[str] = None
     alliance_last_actual_at: Optional[str] = None
+    alliance_last_prediction_date: Optional[str] = None
+    alliance_last_actual_date: Optional[str] = None
     alliance_prediction_time: Optional[str] = None
     alliance_current_time: Optional[str] = None
     alliance_prediction_day: Optional[int] = None
@@ -263,9 +292,10 @@ class CompPreset:
         return cls(name=name, config=config)
 
     def to_dict(self) -> Dict[str, Any]:
+        # The config stays a dataclass; orjson serialises it without an asdict() copy.
         return {
             "name": self.name,
-            "config": asdict(self.config.copy(include_runtime_fields=False)),
+            "config": self.config.copy(include_runtime_fields=False),
         }
 
 
@@ -401,7 +431,7 @@ class CompSchedule:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RssFeedConfig:
     """Persisted configuration for an RSS or Atom feed subscription."""
 
@@ -412,7 +442,7 @@ class RssFeedConfig:
     last_entry_published_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildRecord:
     """Persisted representation of a Guild Wars 2 build."""
 
@@ -432,7 +462,7 @@ class BuildRecord:
     thread_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcDpsStatus:
     """Persisted information about the latest ArcDPS release."""
 
@@ -440,7 +470,7 @@ class ArcDpsStatus:
     last_updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNotesStatus:
     """Persisted information about the latest posted game update notes."""
 
@@ -531,23 +561,45 @@ class ApiKeyRecord:
         )
 
 
+def _dumps_text(value: Any) -> str:
+    """Encode ``value`` for a JSON ``TEXT`` column."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class ApiKeyStore:
     """SQLite-backed persistence for API keys with query-friendly indexes."""
 
     def __init__(self, root: Path) -> None:
         self.root = root
         self.path = root / "api_keys.sqlite"
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._ensure_schema()
         self._migrate_json_stores()
 
     def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.path)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
         connection.row_factory = sqlite3.Row
         connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute("PRAGMA cache_size = -20000")
         return connection
 
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection, committing on success and rolling back on error."""
+
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            with self._connection:
+                yield self._connection
+
     def _ensure_schema(self) -> None:
-        with self._connect() as connection:
+        with self._conn() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
             connection.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS api_keys (
@@ -617,7 +669,7 @@ class ApiKeyStore:
             except (IndexError, ValueError):
                 continue
 
-            with self._connect() as connection:
+            with self._conn() as connection:
                 existing = connection.execute(
                     "SELECT COUNT(1) FROM api_keys WHERE guild_id = ?", (guild_id,)
                 ).fetchone()[0]
@@ -655,11 +707,10 @@ class ApiKeyStore:
     def _read_json(path: Path, default: Any) -> Any:
         if not path.exists():
             return default
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(path.read_bytes())
 
     def get_preferred_guild_role(self, guild_id: int, user_id: int) -> Optional[int]:
-        with self._connect() as connection:
+        with self._conn() as connection:
             row = connection.execute(
                 "SELECT role_id FROM preferred_guild_roles WHERE guild_id = ? AND user_id = ?",
                 (guild_id, user_id),
@@ -674,7 +725,7 @@ class ApiKeyStore:
     def set_preferred_guild_role(
         self, guild_id: int, user_id: int, role_id: Optional[int]
     ) -> None:
-        with self._connect() as connection:
+        with self._conn() as connection:
             if role_id is None:
                 connection.execute(
                     "DELETE FROM preferred_guild_roles WHERE guild_id = ? AND user_id = ?",
@@ -693,7 +744,7 @@ class ApiKeyStore:
             )
 
     def clear_preferred_guild_role_for_role(self, guild_id: int, role_id: int) -> None:
-        with self._connect() as connection:
+        with self._conn() as connection:
             connection.execute(
                 "DELETE FROM preferred_guild_roles WHERE guild_id = ? AND role_id = ?",
                 (guild_id, role_id),
@@ -765,7 +816,7 @@ class ApiKeyStore:
         if not rows:
             return
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             connection.executemany(
                 """
                 INSERT INTO guild_details (guild_id, name, tag, label, updated_at)
@@ -789,22 +840,22 @@ class ApiKeyStore:
         placeholders = ",".join("?" for _ in normalized)
         query = f"SELECT guild_id, label FROM guild_details WHERE guild_id IN ({placeholders})"
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             rows = connection.execute(query, normalized).fetchall()
 
         return {row["guild_id"]: row["label"] for row in rows}
 
     @staticmethod
     def _row_to_record(row: sqlite3.Row) -> ApiKeyRecord:
-        permissions = json.loads(row["permissions"]) if row["permissions"] else []
-        guild_ids = json.loads(row["guild_ids"]) if row["guild_ids"] else []
+        permissions = orjson.loads(row["permissions"]) if row["permissions"] else []
+        guild_ids = orjson.loads(row["guild_ids"]) if row["guild_ids"] else []
         guild_labels = (
-            json.loads(row["guild_labels"])
+            orjson.loads(row["guild_labels"])
             if "guild_labels" in row.keys() and row["guild_labels"]
             else {}
         )
         characters = (
-            json.loads(row["characters"])
+            orjson.loads(row["characters"])
             if "characters" in row.keys() and row["characters"]
             else []
         )
@@ -829,7 +880,7 @@ class ApiKeyStore:
         )
 
     def _fetch_records(self, query: str, params: Sequence[Any]) -> List[ApiKeyRecord]:
-        with self._connect() as connection:
+        with self._conn() as connection:
             rows = connection.execute(query, params).fetchall()
         return [self._row_to_record(row) for row in rows]
 
@@ -862,18 +913,19 @@ class ApiKeyStore:
             if record.name.strip() and record.key.strip()
         ]
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             connection.execute(
                 "DELETE FROM api_keys WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
             )
-            for record in normalised_records:
-                cursor = connection.execute(
-                    """
-                    INSERT INTO api_keys (
-                        guild_id, user_id, name, name_normalized, key, account_name,
-                        permissions, guild_ids, guild_labels, characters, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            # The records are already normalised above, so they are written as-is.
+            connection.executemany(
+                """
+                INSERT INTO api_keys (
+                    guild_id, user_id, name, name_normalized, key, account_name,
+                    permissions, guild_ids, guild_labels, characters, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         guild_id,
                         user_id,
@@ -881,18 +933,30 @@ class ApiKeyStore:
                         record.name.lower(),
                         record.key,
                         record.account_name,
-                        json.dumps(self._normalise_permissions(record.permissions)),
-                        json.dumps(self._normalise_guild_ids(record.guild_ids)),
-                        json.dumps(record.guild_labels),
-                        json.dumps(self._normalise_characters(record.characters)),
+                        _dumps_text(record.permissions),
+                        _dumps_text(record.guild_ids),
+                        _dumps_text(record.guild_labels),
+                        _dumps_text(record.characters),
                         record.created_at,
                         record.updated_at,
-                    ),
-                )
-                api_key_id = cursor.lastrowid
-                self._persist_guild_links(
-                    connection, api_key_id, self._normalise_guild_ids(record.guild_ids)
-                )
+                    )
+                    for record in normalised_records
+                ],
+            )
+            key_ids = dict(
+                connection.execute(
+                    "SELECT name_normalized, id FROM api_keys WHERE guild_id = ? AND user_id = ?",
+                    (guild_id, user_id),
+                ).fetchall()
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO api_key_guilds (api_key_id, guild_id) VALUES (?, ?)",
+                [
+                    (key_ids[record.name.lower()], gw2_guild_id)
+                    for record in normalised_records
+                    for gw2_guild_id in record.guild_ids
+                ],
+            )
 
     def find_api_key(self, guild_id: int, user_id: int, name: str) -> Optional[ApiKeyRecord]:
         results = self._fetch_records(
@@ -920,7 +984,7 @@ class ApiKeyStore:
         if not name_normalized or not key_value:
             return
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             existing = connection.execute(
                 """
                 SELECT id, created_at FROM api_keys
@@ -943,10 +1007,10 @@ class ApiKeyStore:
                         record.name.strip(),
                         key_value,
                         account_name,
-                        json.dumps(permissions),
-                        json.dumps(guild_ids),
-                        json.dumps(guild_labels),
-                        json.dumps(characters),
+                        _dumps_text(permissions),
+                        _dumps_text(guild_ids),
+                        _dumps_text(guild_labels),
+                        _dumps_text(characters),
                         utcnow(),
                         created_at,
                         existing["id"],
@@ -971,10 +1035,10 @@ class ApiKeyStore:
                         name_normalized,
                         key_value,
                         account_name,
-                        json.dumps(permissions),
-                        json.dumps(guild_ids),
-                        json.dumps(guild_labels),
-                        json.dumps(characters),
+                        _dumps_text(permissions),
+                        _dumps_text(guild_ids),
+                        _dumps_text(guild_labels),
+                        _dumps_text(characters),
                         record.created_at,
                         utcnow(),
                     ),
@@ -983,7 +1047,7 @@ class ApiKeyStore:
                 self._persist_guild_links(connection, api_key_id, guild_ids)
 
     def delete_api_key(self, guild_id: int, user_id: int, name: str) -> bool:
-        with self._connect() as connection:
+        with self._conn() as connection:
             cursor = connection.execute(
                 "DELETE FROM api_keys WHERE guild_id = ? AND user_id = ? AND name_normalized = ?",
                 (guild_id, user_id, name.lower()),
@@ -1023,7 +1087,7 @@ class ApiKeyStore:
             "ORDER BY ak.guild_id, ak.user_id, ak.name_normalized"
         )
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             rows = connection.execute(query, params).fetchall()
 
         return [
@@ -1034,7 +1098,7 @@ class ApiKeyStore:
     def all_api_keys(self) -> List[Tuple[int, int, ApiKeyRecord]]:
         """Return every stored API key across all guilds."""
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             rows = connection.execute(
                 "SELECT * FROM api_keys ORDER BY guild_id, user_id, name_normalized"
             ).fetchall()
@@ -1047,7 +1111,7 @@ class ApiKeyStore:
     def all_gw2_guild_ids(self) -> List[str]:
         """Return all distinct Guild Wars 2 guild IDs referenced by stored keys."""
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             rows = connection.execute(
                 "SELECT DISTINCT guild_id FROM api_key_guilds ORDER BY guild_id"
             ).fetchall()
@@ -1056,7 +1120,7 @@ class ApiKeyStore:
 
     def count_api_keys(self, guild_id: int) -> int:
         """Return the number of API keys registered for the given guild."""
-        with self._connect() as conn:
+        with self._conn() as conn:
             row = conn.execute(
                 "SELECT COUNT(*) FROM api_keys WHERE guild_id = ?",
                 (guild_id,),
@@ -1066,7 +1130,7 @@ class ApiKeyStore:
     def clear_guild_details(self) -> None:
         """Remove all cached guild details."""
 
-        with self._connect() as connection:
+        with self._conn() as connection:
             connection.execute("DELETE FROM guild_details")
 
 
@@ -1289,6 +1353,229 @@ class AuditStore:
             )
 
 
+_BUILD_COLUMNS = tuple(column.name for column in fields(BuildRecord))
+_RSS_FEED_COLUMNS = tuple(column.name for column in fields(RssFeedConfig))
+_UPSERT_BUILD_SQL = f"""
+    INSERT INTO builds (guild_id, {', '.join(_BUILD_COLUMNS)})
+    VALUES ({', '.join('?' * (len(_BUILD_COLUMNS) + 1))})
+    ON CONFLICT(guild_id, build_id) DO UPDATE SET
+        {', '.join(f'{column} = excluded.{column}' for column in _BUILD_COLUMNS[1:])}
+"""
+_UPSERT_RSS_FEED_SQL = f"""
+    INSERT INTO rss_feeds (guild_id, name_normalized, {', '.join(_RSS_FEED_COLUMNS)})
+    VALUES ({', '.join('?' * (len(_RSS_FEED_COLUMNS) + 2))})
+    ON CONFLICT(guild_id, name_normalized) DO UPDATE SET
+        {', '.join(f'{column} = excluded.{column}' for column in _RSS_FEED_COLUMNS)}
+"""
+
+
+class GuildRecordStore:
+    """SQLite-backed build and RSS feed records for every Discord guild.
+
+    Single-record updates touch one row instead of rewriting a whole JSON file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / "guild_records.sqlite"
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._ensure_schema()
+        self._migrate_json_stores()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection, committing on success and rolling back on error."""
+
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            with self._connection:
+                yield self._connection
+
+    def _ensure_schema(self) -> None:
+        with self._conn() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS builds (
+                    guild_id INTEGER NOT NULL,
+                    build_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    profession TEXT NOT NULL,
+                    specialization TEXT,
+                    url TEXT,
+                    chat_code TEXT NOT NULL,
+                    description TEXT,
+                    created_by INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_by INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    message_id INTEGER,
+                    channel_id INTEGER,
+                    thread_id INTEGER,
+                    PRIMARY KEY(guild_id, build_id)
+                );
+                CREATE TABLE IF NOT EXISTS rss_feeds (
+                    guild_id INTEGER NOT NULL,
+                    name_normalized TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    last_entry_id TEXT,
+                    last_entry_published_at TEXT,
+                    PRIMARY KEY(guild_id, name_normalized)
+                );
+                CREATE TABLE IF NOT EXISTS json_imports (
+                    guild_id INTEGER NOT NULL,
+                    document TEXT NOT NULL,
+                    PRIMARY KEY(guild_id, document)
+                );
+                """
+            )
+
+    def _migrate_json_stores(self) -> None:
+        """Import legacy ``builds.json`` and ``rss_feeds.json`` files once per guild.
+
+        Rows that cannot be stored are logged and skipped so one bad record
+        neither blocks start-up nor drops the rest of the document.
+        """
+
+        for guild_dir in self.root.glob("guild_*"):
+            if not guild_dir.is_dir():
+                continue
+            try:
+                guild_id = int(str(guild_dir.name).split("guild_", 1)[1])
+            except (IndexError, ValueError):
+                continue
+            for document, table, record_type, upsert_sql, to_row in (
+                ("builds.json", "builds", BuildRecord, _UPSERT_BUILD_SQL, self._build_row),
+                ("rss_feeds.json", "rss_feeds", RssFeedConfig, _UPSERT_RSS_FEED_SQL, self._rss_feed_row),
+            ):
+                path = guild_dir / document
+                if not path.exists():
+                    continue
+                with self._conn() as connection:
+                    imported = connection.execute(
+                        "SELECT 1 FROM json_imports WHERE guild_id = ? AND document = ?",
+                        (guild_id, document),
+                    ).fetchone()
+                if imported:
+                    continue
+                try:
+                    payload = orjson.loads(path.read_bytes())
+                except (OSError, orjson.JSONDecodeError):
+                    logger.exception("Failed to import legacy %s for guild %s", document, guild_id)
+                    continue
+                with self._conn() as connection:
+                    connection.execute(f"DELETE FROM {table} WHERE guild_id = ?", (guild_id,))
+                    for index, item in enumerate(payload if isinstance(payload, list) else []):
+                        try:
+                            connection.execute(upsert_sql, to_row(guild_id, record_type(**item)))
+                        except (AttributeError, TypeError, sqlite3.Error) as exc:
+                            logger.warning(
+                                "Skipping invalid entry %s in legacy %s for guild %s: %s",
+                                index,
+                                document,
+                                guild_id,
+                                exc,
+                            )
+                    connection.execute(
+                        "INSERT OR IGNORE INTO json_imports (guild_id, document) VALUES (?, ?)",
+                        (guild_id, document),
+                    )
+
+    @staticmethod
+    def _build_row(guild_id: int, build: BuildRecord) -> Tuple[Any, ...]:
+        return (guild_id, *astuple(build))
+
+    @staticmethod
+    def _rss_feed_row(guild_id: int, feed: RssFeedConfig) -> Tuple[Any, ...]:
+        return (guild_id, feed.name.lower(), *astuple(feed))
+
+    # ------------------------------------------------------------------
+    # Builds
+    # ------------------------------------------------------------------
+    def get_builds(self, guild_id: int) -> List[BuildRecord]:
+        with self._conn() as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(_BUILD_COLUMNS)} FROM builds WHERE guild_id = ? ORDER BY rowid",
+                (guild_id,),
+            ).fetchall()
+        return [BuildRecord(*row) for row in rows]
+
+    def upsert_build(self, guild_id: int, record: BuildRecord) -> None:
+        with self._conn() as connection:
+            connection.execute(_UPSERT_BUILD_SQL, self._build_row(guild_id, record))
+
+    def delete_build(self, guild_id: int, build_id: str) -> bool:
+        with self._conn() as connection:
+            cursor = connection.execute(
+                "DELETE FROM builds WHERE guild_id = ? AND build_id = ?", (guild_id, build_id)
+            )
+        return cursor.rowcount > 0
+
+    def replace_builds(self, guild_id: int, builds: Iterable[BuildRecord]) -> None:
+        with self._conn() as connection:
+            connection.execute("DELETE FROM builds WHERE guild_id = ?", (guild_id,))
+            connection.executemany(
+                _UPSERT_BUILD_SQL, [self._build_row(guild_id, build) for build in builds]
+            )
+
+    # ------------------------------------------------------------------
+    # RSS feeds
+    # ------------------------------------------------------------------
+    def get_rss_feeds(self, guild_id: int) -> List[RssFeedConfig]:
+        with self._conn() as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(_RSS_FEED_COLUMNS)} FROM rss_feeds WHERE guild_id = ? ORDER BY rowid",
+                (guild_id,),
+            ).fetchall()
+        return [RssFeedConfig(*row) for row in rows]
+
+    def upsert_rss_feed(self, guild_id: int, feed: RssFeedConfig) -> None:
+        with self._conn() as connection:
+            connection.execute(_UPSERT_RSS_FEED_SQL, self._rss_feed_row(guild_id, feed))
+
+    def delete_rss_feed(self, guild_id: int, name: str) -> bool:
+        with self._conn() as connection:
+            cursor = connection.execute(
+                "DELETE FROM rss_feeds WHERE guild_id = ? AND name_normalized = ?",
+                (guild_id, name.lower()),
+            )
+        return cursor.rowcount > 0
+
+    def replace_rss_feeds(self, guild_id: int, feeds: Iterable[RssFeedConfig]) -> None:
+        with self._conn() as connection:
+            connection.execute("DELETE FROM rss_feeds WHERE guild_id = ?", (guild_id,))
+            connection.executemany(
+                _UPSERT_RSS_FEED_SQL,
+                [self._rss_feed_row(guild_id, feed) for feed in feeds],
+            )
+
+
+_UNLOADED: Any = object()
+
+
+@dataclass(slots=True)
+class _GuildState:
+    """Parsed documents for one guild, each loaded on first access."""
+
+    path: Path
+    config: Optional[GuildConfig] = None
+    builds: Optional[Dict[str, BuildRecord]] = None
+    rss_feeds: Optional[Dict[str, RssFeedConfig]] = None
+    # ``None`` records a missing status file, so these start as ``_UNLOADED``.
+    arcdps: Optional[ArcDpsStatus] = _UNLOADED
+    update_notes: Optional[UpdateNotesStatus] = _UNLOADED
+
+
 class StorageManager:
     """Handle isolated storage per guild to respect data privacy."""
 
@@ -1296,15 +1583,47 @@ class StorageManager:
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
         self.api_key_store = ApiKeyStore(self.root)
+        self.record_store = GuildRecordStore(self.root)
         self._audit_stores: Dict[int, AuditStore] = {}
+        # Parsed per-guild documents. Every writer goes through this class, so
+        # entries are refreshed on save and never expire on their own.
+        self._states: Dict[int, _GuildState] = {}
+        self._pending_writes: Dict[Path, bytes] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Payloads handed to the writer thread but not yet on disk.
+        self._writing: Dict[Path, bytes] = {}
+        self._writing_lock = threading.Lock()
+        # Payloads whose background write failed; retried with the next batch.
+        self._failed_writes: Dict[Path, bytes] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-writer")
+        # Last payload queued for each path, so unchanged saves can be skipped.
+        # Shared with the writer thread, so only touched under ``_writing_lock``.
+        self._written: Dict[Path, bytes] = {}
 
     # ------------------------------------------------------------------
     # Generic helpers
     # ------------------------------------------------------------------
+    def invalidate(self, guild_id: int) -> None:
+        """Drop cached documents for ``guild_id`` after an external write."""
+
+        state = self._states.get(guild_id)
+        if state is not None:
+            self._states[guild_id] = _GuildState(state.path)
+            with self._writing_lock:
+                for path in [path for path in self._written if path.parent == state.path]:
+                    del self._written[path]
+
+    def _state(self, guild_id: int) -> _GuildState:
+        state = self._states.get(guild_id)
+        if state is None:
+            guild_path = self.root / f"guild_{guild_id}"
+            guild_path.mkdir(exist_ok=True)
+            state = self._states[guild_id] = _GuildState(guild_path)
+        return state
+
     def _guild_path(self, guild_id: int) -> Path:
-        guild_path = self.root / f"guild_{guild_id}"
-        guild_path.mkdir(exist_ok=True)
-        return guild_path
+        return self._state(guild_id).path
 
     def get_audit_store(self, guild_id: int) -> AuditStore:
         store = self._audit_stores.get(guild_id)
@@ -1314,24 +1633,155 @@ class StorageManager:
         return store
 
     def _read_json(self, path: Path, default: Any) -> Any:
-        if not path.exists():
-            return default
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        raw = self._pending_writes.get(path)
+        if raw is None:
+            with self._writing_lock:
+                raw = self._writing.get(path)
+                if raw is None:
+                    raw = self._failed_writes.get(path)
+        if raw is None:
+            try:
+                return self._load_json_file(path)
+            except FileNotFoundError:
+                return default
+        return orjson.loads(raw)
+
+    @staticmethod
+    def _load_json_file(path: Path) -> Any:
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size < MMAP_READ_THRESHOLD:
+                return orjson.loads(handle.read())
+            # Parse larger files straight from the page cache instead of copying them first.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
 
     def _write_json(self, path: Path, data: Any) -> None:
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2)
+        """Queue ``data`` for ``path``, coalescing writes made in quick succession.
+
+        Inside a running event loop, writes are handed to a background writer
+        thread shortly after the first one is queued; reads see queued payloads
+        immediately. Without a loop the file is written before returning.
+        """
+
+        # orjson serialises dataclasses natively, so callers pass them without asdict().
+        raw = orjson.dumps(data, option=JSON_WRITE_OPTIONS)
+        self._queue_write(path, raw)
+
+    def _queue_write(self, path: Path, raw: bytes) -> None:
+        with self._writing_lock:
+            if self._written.get(path) == raw:
+                return
+            self._written[path] = raw
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pending_writes.pop(path, None)
+            # Go through the writer so this cannot overtake a batch still in flight.
+            try:
+                self._writer.submit(self._write_file, path, raw).result()
+            except BaseException:
+                with self._writing_lock:
+                    if self._written.get(path) is raw:
+                        del self._written[path]
+                raise
+            return
+        self._loop = loop
+        self._pending_writes[path] = raw
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(WRITE_FLUSH_DELAY, self._scheduled_flush)
+
+    def _scheduled_flush(self) -> None:
+        self._flush_handle = None
+        self._submit_pending()
+
+    def _submit_pending(self) -> Future:
+        pending, self._pending_writes = self._pending_writes, {}
+        with self._writing_lock:
+            # Retry earlier failures unless a newer payload for the path replaces them.
+            batch, self._failed_writes = self._failed_writes, {}
+            batch.update(pending)
+            self._writing.update(batch)
+        # A single worker keeps batches, and so writes to the same path, in order.
+        return self._writer.submit(self._write_batch, batch)
+
+    def _write_batch(self, pending: Dict[Path, bytes]) -> None:
+        errors: List[OSError] = []
+        for path, raw in pending.items():
+            try:
+                self._replace_file(path, raw)
+            except OSError as exc:
+                logger.exception("Failed to write %s", path)
+                errors.append(exc)
+                # Keep the payload so the next batch, or flush(), writes it again.
+                with self._writing_lock:
+                    self._failed_writes[path] = raw
+            else:
+                # Batches run in order, so any recorded failure for this path is older.
+                with self._writing_lock:
+                    self._failed_writes.pop(path, None)
+            finally:
+                with self._writing_lock:
+                    if self._writing.get(path) is raw:
+                        del self._writing[path]
+        if errors:
+            self._schedule_retry()
+            raise errors[0]
+
+    def _write_file(self, path: Path, raw: bytes) -> None:
+        with self._writing_lock:
+            # This payload supersedes any failed background write of the path.
+            self._failed_writes.pop(path, None)
+        self._replace_file(path, raw)
+
+    def _schedule_retry(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._schedule_retry_flush)
+        except RuntimeError:
+            # The loop is closed; flush() picks the failed writes up instead.
+            pass
+
+    def _schedule_retry_flush(self) -> None:
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(WRITE_RETRY_DELAY, self._scheduled_flush)
+
+    def flush(self) -> None:
+        """Write any queued JSON documents to disk and wait for them to land.
+
+        Raises the first ``OSError`` if a queued document still cannot be written.
+        """
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._submit_pending().result()
+
+    @staticmethod
+    def _replace_file(path: Path, raw: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
 
     # ------------------------------------------------------------------
     # Configuration
     # ------------------------------------------------------------------
     def get_config(self, guild_id: int) -> GuildConfig:
+        state = self._state(guild_id)
+        if state.config is not None:
+            return copy.deepcopy(state.config)
+        config = self._load_config(guild_id)
+        state.config = copy.deepcopy(config)
+        return config
+
+    def _load_config(self, guild_id: int) -> GuildConfig:
         path = self._guild_path(guild_id) / "config.json"
         payload = self._read_json(path, None)
         if not payload:
             return GuildConfig.default()
-        payload = dict(payload)
+        # _read_json parses a fresh dict on every call, so it is safe to clean in place.
         guild_role_ids = payload.get("guild_role_ids")
         if isinstance(guild_role_ids, dict):
             cleaned_roles: Dict[str, int] = {}
@@ -1514,6 +1964,12 @@ class StorageManager:
                 payload["alliance_current_day"] = day_value if 0 <= day_value <= 6 else None
         else:
             payload["alliance_current_day"] = None
+        for date_key in ("alliance_last_prediction_date", "alliance_last_actual_date"):
+            posted_on = payload.get(date_key)
+            try:
+                payload[date_key] = date.fromisoformat(posted_on).isoformat() if isinstance(posted_on, str) else None
+            except ValueError:
+                payload[date_key] = None
         config = GuildConfig(**payload)
         if migrated_schedules:
             logger.info(
@@ -1677,7 +2133,8 @@ class StorageManager:
             except (TypeError, ValueError):
                 config.alliance_server_id = None
         path = self._guild_path(guild_id) / "config.json"
-        self._write_json(path, asdict(config))
+        self._write_json(path, config)
+        self._state(guild_id).config = copy.deepcopy(config)
 
     # ------------------------------------------------------------------
     # Guild audit cache
@@ -1774,31 +2231,48 @@ class StorageManager:
     # ArcDPS updates
     # ------------------------------------------------------------------
     def get_arcdps_status(self, guild_id: int) -> Optional[ArcDpsStatus]:
-        path = self._guild_path(guild_id) / "arcdps.json"
-        payload = self._read_json(path, None)
-        if not payload:
-            return None
-        if "last_checked_at" not in payload and "last_updated_at" in payload:
-            payload["last_checked_at"] = payload["last_updated_at"]
-        return ArcDpsStatus(**payload)
+        state = self._state(guild_id)
+        if state.arcdps is _UNLOADED:
+            payload = self._read_json(state.path / "arcdps.json", None)
+            if not payload:
+                state.arcdps = None
+            else:
+                if "last_checked_at" not in payload and "last_updated_at" in payload:
+                    payload["last_checked_at"] = payload["last_updated_at"]
+                state.arcdps = ArcDpsStatus(**payload)
+        return replace(state.arcdps) if state.arcdps is not None else None
 
     def save_arcdps_status(self, guild_id: int, status: ArcDpsStatus) -> None:
-        path = self._guild_path(guild_id) / "arcdps.json"
-        self._write_json(path, asdict(status))
+        state = self._state(guild_id)
+        self._write_json(state.path / "arcdps.json", status)
+        state.arcdps = replace(status)
 
     # ------------------------------------------------------------------
     # Game update notes
     # ------------------------------------------------------------------
     def get_update_notes_status(self, guild_id: int) -> Optional[UpdateNotesStatus]:
-        path = self._guild_path(guild_id) / "update_notes.json"
-        payload = self._read_json(path, None)
-        if not payload:
-            return None
-        return UpdateNotesStatus(**payload)
+        state = self._state(guild_id)
+        if state.update_notes is _UNLOADED:
+            payload = self._read_json(state.path / "update_notes.json", None)
+            state.update_notes = UpdateNotesStatus(**payload) if payload else None
+        return replace(state.update_notes) if state.update_notes is not None else None
 
     def save_update_notes_status(self, guild_id: int, status: UpdateNotesStatus) -> None:
-        path = self._guild_path(guild_id) / "update_notes.json"
-        self._write_json(path, asdict(status))
+        state = self._state(guild_id)
+        self._write_json(state.path / "update_notes.json", status)
+        state.update_notes = replace(status)
+
+    # ------------------------------------------------------------------
+    # Alliance sheet cache
+    # ------------------------------------------------------------------
+    def get_alliance_sheet_cache(self) -> Dict[str, Any]:
+        payload = self._read_json(self.root / "alliance_sheets.json", {})
+        if not isinstance(payload, dict):
+            return {}
+        return payload
+
+    def save_alliance_sheet_cache(self, cache: Mapping[str, Any]) -> None:
+        self._write_json(self.root / "alliance_sheets.json", dict(cache))
 
     # ------------------------------------------------------------------
     # API keys
@@ -1863,91 +2337,86 @@ class StorageManager:
     # ------------------------------------------------------------------
     # RSS feed subscriptions
     # ------------------------------------------------------------------
+    def _rss_feed_index(self, guild_id: int) -> Dict[str, RssFeedConfig]:
+        state = self._state(guild_id)
+        if state.rss_feeds is None:
+            state.rss_feeds = self._index_rss_feeds(self.record_store.get_rss_feeds(guild_id))
+        return state.rss_feeds
+
+    @staticmethod
+    def _index_rss_feeds(feeds: Iterable[RssFeedConfig]) -> Dict[str, RssFeedConfig]:
+        index: Dict[str, RssFeedConfig] = {}
+        for feed in feeds:
+            index.setdefault(feed.name.lower(), replace(feed))
+        return index
+
     def get_rss_feeds(self, guild_id: int) -> List[RssFeedConfig]:
-        path = self._guild_path(guild_id) / "rss_feeds.json"
-        payload = self._read_json(path, [])
-        feeds: List[RssFeedConfig] = []
-        for item in payload:
-            try:
-                feeds.append(RssFeedConfig(**item))
-            except TypeError:
-                continue
-        return feeds
+        return [replace(feed) for feed in self._rss_feed_index(guild_id).values()]
 
     def save_rss_feeds(self, guild_id: int, feeds: List[RssFeedConfig]) -> None:
-        path = self._guild_path(guild_id) / "rss_feeds.json"
-        self._write_json(path, [asdict(feed) for feed in feeds])
+        index = self._state(guild_id).rss_feeds = self._index_rss_feeds(feeds)
+        self.record_store.replace_rss_feeds(guild_id, index.values())
 
     def find_rss_feed(self, guild_id: int, name: str) -> Optional[RssFeedConfig]:
-        name_lower = name.lower()
-        for feed in self.get_rss_feeds(guild_id):
-            if feed.name.lower() == name_lower:
-                return feed
-        return None
+        feed = self._rss_feed_index(guild_id).get(name.lower())
+        return replace(feed) if feed is not None else None
 
     def upsert_rss_feed(self, guild_id: int, feed: RssFeedConfig) -> None:
-        feeds = self.get_rss_feeds(guild_id)
-        updated: List[RssFeedConfig] = []
-        replaced = False
-        for existing in feeds:
-            if existing.name.lower() == feed.name.lower():
-                updated.append(feed)
-                replaced = True
-            else:
-                updated.append(existing)
-        if not replaced:
-            updated.append(feed)
-        self.save_rss_feeds(guild_id, updated)
+        index = self._rss_feed_index(guild_id)
+        if index.get(feed.name.lower()) == feed:
+            return
+        index[feed.name.lower()] = replace(feed)
+        self.record_store.upsert_rss_feed(guild_id, feed)
 
     def delete_rss_feed(self, guild_id: int, name: str) -> bool:
-        feeds = self.get_rss_feeds(guild_id)
-        remaining = [feed for feed in feeds if feed.name.lower() != name.lower()]
-        if len(remaining) == len(feeds):
+        index = self._rss_feed_index(guild_id)
+        if index.pop(name.lower(), None) is None:
             return False
-        self.save_rss_feeds(guild_id, remaining)
+        self.record_store.delete_rss_feed(guild_id, name)
         return True
 
     # ------------------------------------------------------------------
     # Builds
     # ------------------------------------------------------------------
+    def _build_index(self, guild_id: int) -> Dict[str, BuildRecord]:
+        state = self._state(guild_id)
+        if state.builds is None:
+            state.builds = self._index_builds(self.record_store.get_builds(guild_id))
+        return state.builds
+
+    @staticmethod
+    def _index_builds(builds: Iterable[BuildRecord]) -> Dict[str, BuildRecord]:
+        index: Dict[str, BuildRecord] = {}
+        for build in builds:
+            index.setdefault(build.build_id, replace(build))
+        return index
+
     def get_builds(self, guild_id: int) -> List[BuildRecord]:
-        path = self._guild_path(guild_id) / "builds.json"
-        payload = self._read_json(path, [])
-        return [BuildRecord(**item) for item in payload]
+        return [replace(build) for build in self._build_index(guild_id).values()]
 
     def save_builds(self, guild_id: int, builds: List[BuildRecord]) -> None:
-        path = self._guild_path(guild_id) / "builds.json"
-        self._write_json(path, [asdict(build) for build in builds])
+        index = self._state(guild_id).builds = self._index_builds(builds)
+        self.record_store.replace_builds(guild_id, index.values())
 
     # ------------------------------------------------------------------
     # Convenience helpers
     # ------------------------------------------------------------------
     def find_build(self, guild_id: int, build_id: str) -> Optional[BuildRecord]:
-        for build in self.get_builds(guild_id):
-            if build.build_id == build_id:
-                return build
-        return None
+        build = self._build_index(guild_id).get(build_id)
+        return replace(build) if build is not None else None
 
     def upsert_build(self, guild_id: int, record: BuildRecord) -> None:
-        builds = self.get_builds(guild_id)
-        updated: List[BuildRecord] = []
-        replaced = False
-        for build in builds:
-            if build.build_id == record.build_id:
-                updated.append(record)
-                replaced = True
-            else:
-                updated.append(build)
-        if not replaced:
-            updated.append(record)
-        self.save_builds(guild_id, updated)
+        index = self._build_index(guild_id)
+        if index.get(record.build_id) == record:
+            return
+        index[record.build_id] = replace(record)
+        self.record_store.upsert_build(guild_id, record)
 
     def delete_build(self, guild_id: int, build_id: str) -> bool:
-        builds = self.get_builds(guild_id)
-        remaining = [build for build in builds if build.build_id != build_id]
-        if len(remaining) == len(builds):
+        index = self._build_index(guild_id)
+        if index.pop(build_id, None) is None:
             return False
-        self.save_builds(guild_id, remaining)
+        self.record_store.delete_build(guild_id, build_id)
         return True
 
 
@@ -13,12 +13,12 @@ from . import constants
 def resolve_profession(selection: str) -> Tuple[str, Optional[str]]:
     """Return the base profession and optional specialization for a selection."""
 
-    if selection in constants.PROFESSIONS:
-        return selection, None
-    spec = constants.SPECIALIZATIONS.get(selection)
-    if not spec:
+    entry = constants.CLASS_INDEX.get(selection)
+    if entry is None:
         raise ValueError(f"Unknown class or specialization: {selection}")
-    return spec.profession, spec.name
+    if isinstance(entry, constants.Specialization):
+        return entry.profession, entry.name
+    return selection, None
 
 
 def build_class_display(profession: str, specialization: Optional[str]) -> str:
@@ -11,3 +11,140 @@ def mock_bot_update_notes():
 async def test_update_notes_init(mock_bot_update_notes):
     cog = UpdateNotesCog(mock_bot_update_notes)
     assert cog is not None
+
+SAMPLE_PAGE = """
+<div id="mw-content-text"><div class="mw-parser-output">
+<h2><span class="mw-headline" id="Update_-_October_14,_2025">Update - October 14, 2025</span><span class="mw-editsection">[edit]</span></h2>
+<ul><li>Fixed a <a href="/wiki/Bug">bug</a>.</li></ul>
+<script>var x = 1;</script>
+<h2><span class="mw-headline" id="Update_-_October_7,_2025">Update - October 7, 2025</span></h2>
+<p>Older notes</p>
+<h2><span class="mw-headline" id="Other">Other</span></h2>
+</div></div>
+"""
+
+def _page_response(status_code=200, text=SAMPLE_PAGE, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    return response
+
+@pytest.mark.asyncio
+async def test_update_notes_fetch_entries_parses_sections(mock_bot_update_notes):
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    cog._fetch_response = AsyncMock(return_value=_page_response())
+
+    entries = await cog._fetch_entries()
+
+    assert [entry.entry_id for entry in entries] == [
+        "Update_-_October_14,_2025",
+        "Update_-_October_7,_2025",
+    ]
+    assert entries[0].content == "- Fixed a [bug](https://wiki.guildwars2.com/wiki/Bug)."
+    assert entries[0].published_at == "2025-10-14T00:00:00+00:00"
+    assert entries[1].content == "Older notes"
+
+@pytest.mark.asyncio
+async def test_update_notes_fetch_entries_reuses_entries_when_not_modified(mock_bot_update_notes):
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    cog._fetch_response = AsyncMock(
+        side_effect=[
+            _page_response(
+                headers={
+                    "ETag": '"abc"',
+                    "Last-Modified": "Tue, 14 Oct 2025 18:00:00 GMT",
+                }
+            ),
+            _page_response(status_code=304, text=""),
+        ]
+    )
+
+    first = await cog._fetch_entries()
+    second = await cog._fetch_entries()
+
+    assert second == first
+    assert cog._fetch_response.await_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 14 Oct 2025 18:00:00 GMT",
+    }
+
+@pytest.mark.asyncio
+async def test_update_notes_fetch_entries_skips_get_when_head_unchanged(mock_bot_update_notes):
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    last_modified = "Tue, 14 Oct 2025 18:00:00 GMT"
+    cog._fetch_response = AsyncMock(
+        return_value=_page_response(headers={"Last-Modified": last_modified})
+    )
+    head_response = MagicMock(ok=True, headers={"Last-Modified": last_modified})
+    cog._session.head = MagicMock(return_value=head_response)
+
+    first = await cog._fetch_entries()
+    second = await cog._fetch_entries()
+
+    assert second == first
+    assert cog._fetch_response.await_count == 1
+
+@pytest.mark.asyncio
+async def test_update_notes_resolve_new_entries_returns_oldest_first(mock_bot_update_notes):
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    entries = cog._parse_entries(SAMPLE_PAGE)
+
+    assert cog._resolve_new_entries(entries, entries[0].entry_id, None) == []
+    assert cog._resolve_new_entries(entries, entries[1].entry_id, None) == [entries[0]]
+    assert cog._resolve_new_entries(entries, "unknown", None) == entries[::-1]
+
+@pytest.mark.asyncio
+async def test_update_notes_poll_posts_new_entries_per_guild(mock_bot_update_notes):
+    import discord
+    from axitools.storage import UpdateNotesStatus
+
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    cog._fetch_response = AsyncMock(return_value=_page_response())
+    entries = cog._parse_entries(SAMPLE_PAGE)
+
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.send = AsyncMock()
+    guild = MagicMock(id=1)
+    guild.get_channel.return_value = channel
+    mock_bot_update_notes.guilds = [guild]
+    mock_bot_update_notes.get_config.return_value = MagicMock(update_notes_channel_id=42)
+    mock_bot_update_notes.storage.get_update_notes_status.return_value = UpdateNotesStatus(
+        last_entry_id=entries[1].entry_id,
+        last_entry_published_at=entries[1].published_at,
+    )
+
+    await cog._poll_updates()
+
+    channel.send.assert_awaited_once()
+    assert channel.send.await_args.kwargs["embed"].title == entries[0].title
+    saved = mock_bot_update_notes.storage.save_update_notes_status.call_args.args
+    assert saved[0] == 1
+    assert saved[1].last_entry_id == entries[0].entry_id
+
+@pytest.mark.asyncio
+async def test_update_notes_poll_saves_status_once_per_guild(mock_bot_update_notes):
+    import discord
+    from axitools.storage import UpdateNotesStatus
+
+    cog = UpdateNotesCog(mock_bot_update_notes)
+    cog._fetch_response = AsyncMock(return_value=_page_response())
+    entries = cog._parse_entries(SAMPLE_PAGE)
+
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.send = AsyncMock()
+    guild = MagicMock(id=1)
+    guild.get_channel.return_value = channel
+    mock_bot_update_notes.guilds = [guild]
+    mock_bot_update_notes.get_config.return_value = MagicMock(update_notes_channel_id=42)
+    mock_bot_update_notes.storage.get_update_notes_status.return_value = UpdateNotesStatus(
+        last_entry_id="Update_-_October_1,_2025",
+    )
+
+    await cog._poll_updates()
+
+    assert channel.send.await_count == 2
+    mock_bot_update_notes.storage.save_update_notes_status.assert_called_once()
+    saved = mock_bot_update_notes.storage.save_update_notes_status.call_args.args[1]
+    assert saved.last_entry_id == entries[0].entry_id
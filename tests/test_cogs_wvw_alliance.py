@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from axitools.storage import GuildConfig
-from axitools.cogs.wvw_alliance import AllianceMatchupCog, AllianceRoster, MatchTeam
+from axitools.cogs.wvw_alliance import PST, AllianceMatchupCog, AllianceRoster, MatchTeam
 
 @pytest.fixture
 def mock_bot_alliance():
@@ -167,6 +168,28 @@ async def test_prediction_world_resolver_matches_alliance_name_rows(mock_bot_all
     assert world_id == 11006
 
 
+def test_parse_alliance_csv_detects_solo_headers_through_cached_normalisation():
+    from axitools.cogs import wvw_alliance
+
+    wvw_alliance._normalized_text.cache_clear()
+    text = (
+        "Alliance,Guilds\n"
+        "[DEFI] Defîance,\"[ABC] One\n[DEF] Two\"\n"
+        ",  Sôlo Guilds!\n"
+        "[SOL] Lone,\n"
+        "SOLO GUILDS,\n"
+        "[XYZ] Other,\n"
+    )
+
+    roster = AllianceMatchupCog._parse_alliance_csv(text)
+
+    assert roster.alliances == [("[DEFI] Defîance", ["[ABC] One", "[DEF] Two"])]
+    assert roster.solo_guilds == ["[SOL] Lone", "[XYZ] Other"]
+    # Re-parsing the same sheet reuses the normalised cells.
+    assert AllianceMatchupCog._parse_alliance_csv(text) == roster
+    assert wvw_alliance._normalized_text.cache_info().hits > 0
+
+
 @pytest.mark.asyncio
 async def test_format_alliance_list_trims_in_display_order(mock_bot_alliance):
     cog = AllianceMatchupCog(mock_bot_alliance)
@@ -237,3 +260,489 @@ async def test_format_alliance_list_trims_in_display_order(mock_bot_alliance):
 
     assert value.endswith("…")
     assert "[PACK] - Wölves Of Wär" in value
+
+
+@pytest.mark.asyncio
+async def test_fetch_alliances_reuses_roster_persisted_by_previous_instance(mock_bot_alliance, tmp_path):
+    from axitools.storage import StorageManager
+
+    mock_bot_alliance.storage = StorageManager(tmp_path)
+    csv_text = 'Alliance,Guilds\n"[AA] Alpha","[G1] One\n[G2] Two"\nSolo Guilds,\n"[S1] Solo",\n'
+
+    first = AllianceMatchupCog(mock_bot_alliance)
+    first._poster_loop.cancel()
+    first._fetch_text = AsyncMock(return_value=csv_text)
+    roster = await first._fetch_alliances("HoJ")
+
+    second = AllianceMatchupCog(mock_bot_alliance)
+    second._poster_loop.cancel()
+    second._fetch_text = AsyncMock(side_effect=AssertionError("should use disk cache"))
+    cached = await second._fetch_alliances("HoJ")
+
+    assert roster.alliances == [("[AA] Alpha", ["[G1] One", "[G2] Two"])]
+    assert roster.solo_guilds == ["[S1] Solo"]
+    assert cached == roster
+
+
+@pytest.mark.asyncio
+async def test_fetch_alliances_coalesces_concurrent_downloads(mock_bot_alliance):
+    import asyncio
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    async def slow_fetch(*args, **kwargs):
+        await asyncio.sleep(0)
+        return 'Alliance,Guilds\n"[AA] Alpha","[G1] One"\n'
+
+    cog._fetch_text = AsyncMock(side_effect=slow_fetch)
+
+    rosters = await asyncio.gather(*(cog._fetch_alliances("HoJ") for _ in range(3)))
+
+    assert cog._fetch_text.await_count == 1
+    assert rosters[0] is rosters[1] is rosters[2]
+
+
+@pytest.mark.asyncio
+async def test_resolve_team_alliances_merges_guilds_across_worlds(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    rosters = {
+        "HoJ": AllianceRoster(alliances=[("[AA] Alpha", ["[G1] One", "[G2] Two"])], solo_guilds=["[S1] Solo"]),
+        "Moogooloo": AllianceRoster(alliances=[("[AA] Alpha", ["[G2] Two", "[G3] Three"])], solo_guilds=["[S1] Solo"]),
+    }
+    cog._fetch_alliances = AsyncMock(side_effect=lambda name: rosters[name])
+
+    merged = await cog._resolve_team_alliances([11006, 11001])
+
+    assert merged.alliances == [("[AA] Alpha", ["[G1] One", "[G2] Two", "[G3] Three"])]
+    assert merged.solo_guilds == ["[S1] Solo"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_matches_reuses_recent_response(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    cog._fetch_json = AsyncMock(return_value=[{"id": "1-1"}, {"id": "1-2"}])
+
+    first = await cog._fetch_matches()
+    second = await cog._fetch_matches()
+
+    assert [match["id"] for match in second] == ["1-1", "1-2"]
+    assert first == second
+    cog._fetch_json.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_predict_tiers_moves_winners_up_and_losers_down(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    def match(tier, vps):
+        return {
+            "tier": tier,
+            "all_worlds": {"green": [tier * 10 + 1], "blue": [tier * 10 + 2], "red": [tier * 10 + 3]},
+            "victory_points": dict(zip(("green", "blue", "red"), vps)),
+        }
+
+    predictions = cog._predict_tiers([match(1, (300, 200, 100)), match(2, (100, 300, 200))])
+
+    assert [item.tier for item in predictions] == [1, 2]
+    tier_one, tier_two = predictions
+    assert [(team.color, list(team.world_ids)) for team in tier_one.teams] == [
+        ("green", [11]),
+        ("blue", [12]),
+        ("red", [22]),
+    ]
+    assert [(team.color, list(team.world_ids)) for team in tier_two.teams] == [
+        ("green", [13]),
+        ("blue", [23]),
+        ("red", [21]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extract_match_teams_falls_back_to_nested_data(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    match = {
+        "all_worlds": {},
+        "data": {
+            "all_worlds": {"green": [1], "blue": [2], "red": "invalid"},
+            "victory_points": {"green": 5, "blue": "x"},
+        },
+    }
+
+    teams = cog._extract_match_teams(match)
+
+    assert teams == [
+        MatchTeam(color="green", world_ids=[1], victory_points=5),
+        MatchTeam(color="blue", world_ids=[2], victory_points=0),
+    ]
+
+
+class _FakeResponse:
+    def __init__(self, status, payload, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import aiohttp
+
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=self.status)
+
+    async def json(self, content_type=None):
+        return self._payload
+
+    async def text(self):
+        return str(self._payload)
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_retries_rate_limited_requests(mock_bot_alliance, monkeypatch):
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    responses = [_FakeResponse(429, None, {"Retry-After": "2"}), _FakeResponse(200, {"ok": True})]
+    session = MagicMock()
+    session.get = MagicMock(side_effect=lambda *args, **kwargs: responses.pop(0))
+    cog._get_session = AsyncMock(return_value=session)
+    sleep = AsyncMock()
+    monkeypatch.setattr(wvw_alliance.asyncio, "sleep", sleep)
+
+    assert await cog._fetch_json("https://example.com") == {"ok": True}
+    assert session.get.call_count == 2
+    delay = sleep.await_args.args[0]
+    assert 2 <= delay <= 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_gives_up_after_repeated_server_errors(mock_bot_alliance, monkeypatch):
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=lambda *args, **kwargs: _FakeResponse(503, None))
+    cog._get_session = AsyncMock(return_value=session)
+    monkeypatch.setattr(wvw_alliance.asyncio, "sleep", AsyncMock())
+
+    with pytest.raises(ValueError):
+        await cog._fetch_json("https://example.com")
+    assert session.get.call_count == wvw_alliance.REQUEST_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_retries_connection_errors_and_timeouts(mock_bot_alliance, monkeypatch):
+    import aiohttp
+
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    outcomes = [aiohttp.ClientConnectionError("reset"), asyncio.TimeoutError(), _FakeResponse(200, {"ok": True})]
+
+    def get(*args, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=get)
+    cog._get_session = AsyncMock(return_value=session)
+    monkeypatch.setattr(wvw_alliance.asyncio, "sleep", AsyncMock())
+
+    assert await cog._fetch_json("https://example.com") == {"ok": True}
+    assert session.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_raises_value_error_after_repeated_timeouts(mock_bot_alliance, monkeypatch):
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=asyncio.TimeoutError())
+    cog._get_session = AsyncMock(return_value=session)
+    monkeypatch.setattr(wvw_alliance.asyncio, "sleep", AsyncMock())
+
+    with pytest.raises(ValueError):
+        await cog._fetch_json("https://example.com")
+    assert session.get.call_count == wvw_alliance.REQUEST_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_lookup_guild_prefers_exact_name_among_concurrent_results(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    details = {
+        "id-1": ValueError("boom"),
+        "id-2": {"name": "Example Guild Two", "tag": "EX2"},
+        "id-3": {"name": "Example Guild", "tag": "EX"},
+    }
+
+    async def fake_fetch(url, params=None):
+        if params:
+            return list(details)
+        result = details[url.rsplit("/", 1)[-1]]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    cog._fetch_json = AsyncMock(side_effect=fake_fetch)
+
+    assert await cog._lookup_guild("example guild") == ("id-3", "Example Guild [EX]")
+    assert cog._fetch_json.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_resolve_team_alliances_fetches_each_sheet_once(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    cog._fetch_alliances = AsyncMock(return_value=AllianceRoster(alliances=[], solo_guilds=[]))
+
+    await cog._resolve_team_alliances([11006, 11006, 99999])
+
+    cog._fetch_alliances.assert_awaited_once_with("HoJ")
+
+
+@pytest.mark.asyncio
+async def test_schedule_view_message_reflects_synced_config(mock_bot_alliance):
+    from axitools.cogs.wvw_alliance import AllianceScheduleView
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    config = GuildConfig.default()
+    config.alliance_prediction_day = 1
+    config.alliance_prediction_time = "08:15"
+    config.alliance_current_day = None
+    config.alliance_current_time = "bogus"
+
+    view = AllianceScheduleView(cog, MagicMock(), config)
+    message = view.build_message()
+
+    assert "**Prediction:** Tuesday at **08:15** PST" in message
+    assert "**Current:** Friday at **19:30** PST" in message
+
+    config.alliance_current_day = 5
+    view.sync_selects()
+    assert "**Current:** Saturday" in view.build_message()
+
+
+@pytest.mark.asyncio
+async def test_fetch_guild_world_map_skips_invalid_entries(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    cog._fetch_json = AsyncMock(return_value={"ABCDEF": "1001", "bad": "world", "": 5, "fedcba": None})
+
+    result = await cog._fetch_guild_world_map("https://example.com/wvw")
+
+    assert result == {"abcdef": 1001}
+
+
+@pytest.mark.asyncio
+async def test_build_embed_lists_only_opponent_rosters(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    teams = [
+        MatchTeam(color="green", world_ids=[11006], victory_points=300),
+        MatchTeam(color="blue", world_ids=[11001], victory_points=200),
+        MatchTeam(color="red", world_ids=[99999], victory_points=100),
+    ]
+    alliances = {
+        cog._format_worlds([11001]): AllianceRoster(alliances=[("[AA] Alpha", ["[G1] One"])], solo_guilds=[]),
+    }
+
+    embed = cog._build_embed(
+        title="WvW Matchup",
+        config=GuildConfig.default(),
+        tier=1,
+        teams=teams,
+        home_world_id=11006,
+        alliances=alliances,
+        confidence=60,
+        confidence_map={11001: 30},
+    )
+
+    team_fields = [field for field in embed.fields if "—" in field.name]
+    assert [field.name.split()[1] for field in team_fields] == ["Blue", "Red"]
+    assert "[AA] Alpha" in team_fields[0].value
+    assert "No roster data found." in team_fields[1].value
+    assert embed.footer.text == "Prediction confidence — Home: 60% | Blue: 30%"
+
+
+@pytest.mark.asyncio
+async def test_build_embed_only_pads_header_without_home_team(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    teams = [MatchTeam(color="green", world_ids=[11006], victory_points=300)]
+    kwargs = dict(title="WvW Matchup", config=GuildConfig.default(), tier=1, teams=teams, alliances={})
+
+    with_home = cog._build_embed(home_world_id=11006, **kwargs)
+    without_home = cog._build_embed(home_world_id=11001, **kwargs)
+
+    assert all(field.name != "\u200b" for field in with_home.fields)
+    assert [field.name for field in without_home.fields][:3] == ["Home world", "Tier", "\u200b"]
+
+
+@pytest.mark.asyncio
+async def test_poster_schedule_is_reused_until_config_changes(mock_bot_alliance):
+    from datetime import time
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    config = GuildConfig.default()
+    config.alliance_prediction_time = "08:30"
+    first = cog._poster_schedule(1, config)
+    assert cog._poster_schedule(1, config) is first
+    assert first.prediction_time == time(8, 30)
+    assert first.current_time == time(19, 30)
+
+    config.alliance_current_day = 2
+    updated = cog._poster_schedule(1, config)
+    assert updated is not first
+    assert updated.current_day == 2
+
+
+@pytest.mark.asyncio
+async def test_poster_loop_skips_channel_lookup_when_nothing_is_due(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    config = GuildConfig.default()
+    config.alliance_channel_id = 555
+    config.alliance_guild_id = "abcdef"
+    now = datetime.now(timezone.utc).isoformat()
+    config.alliance_last_prediction_at = now
+    config.alliance_last_actual_at = now
+
+    guild = MagicMock()
+    guild.id = 123
+    mock_bot_alliance.guilds = [guild]
+    mock_bot_alliance.get_config = MagicMock(return_value=config)
+    cog._resolve_channel = AsyncMock()
+    cog._post_matchup = AsyncMock()
+
+    await cog._poster_loop.coro(cog)
+
+    cog._resolve_channel.assert_not_awaited()
+    cog._post_matchup.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_already_posted_prefers_stored_pst_date(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    now = datetime(2024, 5, 3, 23, 30, tzinfo=PST)
+
+    assert cog._already_posted(None, now, "2024-05-03") is True
+    assert cog._already_posted("2024-05-04T06:00:00.000000Z", now, "2024-05-02") is False
+    # Legacy configs without a stored date fall back to the UTC timestamp.
+    assert cog._already_posted("2024-05-04T06:00:00.000000Z", now) is True
+
+
+@pytest.mark.asyncio
+async def test_poster_loop_posts_due_guilds_concurrently(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+
+    config = GuildConfig.default()
+    config.alliance_channel_id = 555
+    config.alliance_guild_id = "abcdef"
+    weekday = datetime.now(PST).weekday()
+    config.alliance_prediction_day = weekday
+    config.alliance_prediction_time = "00:00"
+    config.alliance_current_day = (weekday + 1) % 7
+
+    guilds = [MagicMock(id=1), MagicMock(id=2)]
+    mock_bot_alliance.guilds = guilds
+    mock_bot_alliance.get_config = MagicMock(return_value=config)
+    started: list[int] = []
+    release = asyncio.Event()
+
+    async def post_matchup(*, guild, channel, config, prediction):
+        started.append(guild.id)
+        if len(started) == len(guilds):
+            release.set()
+        await release.wait()
+        if guild.id == 1:
+            raise RuntimeError("boom")
+        return True
+
+    cog._resolve_channel = AsyncMock(return_value=MagicMock())
+    cog._post_matchup = post_matchup
+
+    await asyncio.wait_for(cog._poster_loop.coro(cog), timeout=1)
+
+    assert sorted(started) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_sheet_download_is_only_cached_briefly(mock_bot_alliance):
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    cog._fetch_text = AsyncMock(side_effect=ValueError("Request failed"))
+
+    roster = await cog._fetch_alliances("HoJ")
+    assert roster == AllianceRoster(alliances=[], solo_guilds=[])
+    assert cog._fresh_sheet_roster("HoJ") is roster
+
+    cog._sheet_cache_at["HoJ"] -= wvw_alliance.SHEET_EMPTY_CACHE_TTL
+    assert cog._fresh_sheet_roster("HoJ") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_stale_roster_without_refetching(mock_bot_alliance):
+    from axitools.cogs import wvw_alliance
+
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    stale = AllianceRoster(alliances=[("Alliance", ["Guild"])], solo_guilds=[])
+    cog._sheet_cache_loaded = True
+    cog._sheet_cache["HoJ"] = stale
+    cog._sheet_cache_at["HoJ"] = datetime.now(timezone.utc) - wvw_alliance.SHEET_CACHE_TTL * 2
+    cog._fetch_text = AsyncMock(side_effect=ValueError("Request failed"))
+
+    assert await cog._fetch_alliances("HoJ") is stale
+    assert await cog._fetch_alliances("HoJ") is stale
+    cog._fetch_text.assert_awaited_once()
+
+    cog._sheet_cache_at["HoJ"] -= wvw_alliance.SHEET_EMPTY_CACHE_TTL
+    assert cog._fresh_sheet_roster("HoJ") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_sheet_cache_clears_memory_and_disk(mock_bot_alliance):
+    cog = AllianceMatchupCog(mock_bot_alliance)
+    cog._poster_loop.cancel()
+    cog._sheet_cache["HoJ"] = AllianceRoster(alliances=[("Alliance", ["Guild"])], solo_guilds=[])
+    cog._sheet_cache_at["HoJ"] = datetime.now(timezone.utc)
+
+    cog.invalidate_sheet_cache()
+
+    assert cog._fresh_sheet_roster("HoJ") is None
+    mock_bot_alliance.storage.save_alliance_sheet_cache.assert_called_with({})
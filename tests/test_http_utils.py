@@ -7,6 +7,14 @@ import zstandard as zstd
 from unittest.mock import AsyncMock, MagicMock
 from axitools import http_utils
 
+
+def _chunks(payload, size=4):
+    async def iterate():
+        for start in range(0, len(payload), size):
+            yield payload[start : start + size]
+
+    return MagicMock(side_effect=lambda chunk_size: iterate())
+
 @pytest.mark.asyncio
 async def test_read_response_text_gzip():
     data = b"hello world"
@@ -14,6 +22,7 @@ async def test_read_response_text_gzip():
     
     response = AsyncMock()
     response.read.return_value = compressed
+    response.content.iter_chunked = _chunks(compressed)
     response.headers = {"Content-Encoding": "gzip"}
     response.charset = "utf-8"
     
@@ -27,6 +36,7 @@ async def test_read_response_text_deflate():
     
     response = AsyncMock()
     response.read.return_value = compressed
+    response.content.iter_chunked = _chunks(compressed)
     response.headers = {"Content-Encoding": "deflate"}
     response.charset = "utf-8"
     
@@ -40,6 +50,7 @@ async def test_read_response_text_brotli():
     
     response = AsyncMock()
     response.read.return_value = compressed
+    response.content.iter_chunked = _chunks(compressed)
     response.headers = {"Content-Encoding": "br"}
     response.charset = "utf-8"
     
@@ -54,6 +65,7 @@ async def test_read_response_text_zstd():
     
     response = AsyncMock()
     response.read.return_value = compressed
+    response.content.iter_chunked = _chunks(compressed)
     response.headers = {"Content-Encoding": "zstd"}
     response.charset = "utf-8"
     
@@ -66,8 +78,80 @@ async def test_read_response_text_identity():
     
     response = AsyncMock()
     response.read.return_value = data
+    response.content.iter_chunked = _chunks(data)
     response.headers = {"Content-Encoding": "identity"}
     response.charset = "utf-8"
     
     text = await http_utils.read_response_text(response)
     assert text == "hello world"
+
+@pytest.mark.asyncio
+async def test_read_response_text_zstd_without_content_size():
+    data = b"hello world"
+    cctx = zstd.ZstdCompressor(write_content_size=False)
+    compressed = cctx.compress(data)
+
+    response = AsyncMock()
+    response.read.return_value = compressed
+    response.content.iter_chunked = _chunks(compressed)
+    response.headers = {"Content-Encoding": "zstd"}
+    response.charset = "utf-8"
+
+    text = await http_utils.read_response_text(response)
+    assert text == "hello world"
+
+@pytest.mark.asyncio
+async def test_read_response_text_passes_through_body_already_decoded_by_transport():
+    response = AsyncMock()
+    response.content.iter_chunked = _chunks(b"hello world")
+    response.headers = {"Content-Encoding": "gzip"}
+    response.charset = "utf-8"
+
+    text = await http_utils.read_response_text(response)
+    assert text == "hello world"
+
+
+def test_parse_content_encoding_normalises_tokens():
+    assert http_utils._parse_content_encoding("") == ()
+    assert http_utils._parse_content_encoding("GZIP") == ("gzip",)
+    assert http_utils._parse_content_encoding(" gzip , br ,") == ("gzip", "br")
+
+
+@pytest.mark.asyncio
+async def test_read_response_text_does_not_return_truncated_gzip_stream():
+    compressed = gzip.compress(bytes(range(256)) * 400)
+    truncated = compressed[: len(compressed) // 2]
+
+    response = AsyncMock()
+    response.content.iter_chunked = _chunks(truncated, size=1024)
+    response.headers = {"Content-Encoding": "gzip"}
+    response.charset = "latin-1"
+
+    text = await http_utils.read_response_text(response)
+    # Same result as decoding the buffered body, not the partial plaintext.
+    assert text == truncated.decode("latin-1")
+
+
+@pytest.mark.asyncio
+async def test_read_response_text_reads_whole_body_after_mid_stream_failure():
+    body = gzip.compress(b"hello")[:10] + b"\xff" * 20
+
+    response = AsyncMock()
+    response.content.iter_chunked = _chunks(body, size=8)
+    response.headers = {"Content-Encoding": "gzip"}
+    response.charset = "latin-1"
+
+    text = await http_utils.read_response_text(response)
+    assert text == body.decode("latin-1")
+
+
+@pytest.mark.asyncio
+async def test_read_response_text_buffers_gzip_with_trailing_data():
+    body = gzip.compress(b"hello") + gzip.compress(b" world")
+
+    response = AsyncMock()
+    response.content.iter_chunked = _chunks(body, size=8)
+    response.headers = {"Content-Encoding": "gzip"}
+    response.charset = "utf-8"
+
+    assert await http_utils.read_response_text(response) == "hello world"
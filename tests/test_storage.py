@@ -72,3 +72,487 @@ def test_audit_gw2_api_key_storage_round_trip(tmp_path):
         "main key": "KEY-ONE",
         "alt.key": "KEY-TWO",
     }
+
+
+def test_get_config_is_cached_and_isolated_from_callers(tmp_path):
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    config = storage.get_config(42)
+    config.alliance_server_id = 1001
+    assert storage.get_config(42).alliance_server_id is None
+
+    storage.save_config(42, config)
+    (tmp_path / "guild_42" / "config.json").unlink()
+    assert storage.get_config(42).alliance_server_id == 1001
+
+    storage.invalidate(42)
+    assert storage.get_config(42).alliance_server_id is None
+
+
+def test_alliance_post_dates_are_validated_on_load(tmp_path):
+    import orjson
+
+    from axitools.storage import StorageManager
+
+    guild_dir = tmp_path / "guild_5"
+    guild_dir.mkdir()
+    (guild_dir / "config.json").write_bytes(
+        orjson.dumps(
+            {
+                "moderator_role_ids": [],
+                "alliance_last_prediction_date": "2024-13-45",
+                "alliance_last_actual_date": "2024-06-07",
+            }
+        )
+    )
+
+    config = StorageManager(tmp_path).get_config(5)
+    assert config.alliance_last_prediction_date is None
+    assert config.alliance_last_actual_date == "2024-06-07"
+
+
+def test_build_upsert_find_and_delete_use_indexed_builds(tmp_path):
+    from axitools.storage import BuildRecord, StorageManager
+
+    def build(build_id, name):
+        return BuildRecord(
+            build_id=build_id,
+            name=name,
+            profession="Guardian",
+            specialization=None,
+            url=None,
+            chat_code="[&AA==]",
+            description=None,
+            created_by=1,
+            created_at="2024-01-01T00:00:00.000000Z",
+            updated_by=1,
+            updated_at="2024-01-01T00:00:00.000000Z",
+        )
+
+    storage = StorageManager(tmp_path)
+    storage.upsert_build(7, build("a", "First"))
+    storage.upsert_build(7, build("b", "Second"))
+    storage.upsert_build(7, build("a", "Renamed"))
+
+    assert [(item.build_id, item.name) for item in storage.get_builds(7)] == [("a", "Renamed"), ("b", "Second")]
+    found = storage.find_build(7, "b")
+    found.name = "Changed locally"
+    assert storage.find_build(7, "b").name == "Second"
+
+    assert storage.delete_build(7, "a") is True
+    assert storage.delete_build(7, "a") is False
+    assert [item.build_id for item in StorageManager(tmp_path).get_builds(7)] == ["b"]
+
+
+def test_write_json_replaces_file_without_leaving_temp_files(tmp_path):
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "x"}})
+
+    assert (tmp_path / "alliance_sheets.json").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_writes_inside_event_loop_are_coalesced_until_flush(tmp_path):
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    path = tmp_path / "alliance_sheets.json"
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "1"}})
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "2"}})
+
+    assert not path.exists()
+    assert storage.get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "2"}}
+
+    storage.flush()
+    assert StorageManager(tmp_path).get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "2"}}
+
+
+def test_utcnow_matches_storage_isoformat():
+    from datetime import datetime
+
+    from axitools.storage import ISOFORMAT, utcnow
+
+    value = utcnow()
+    assert datetime.strptime(value, ISOFORMAT).strftime(ISOFORMAT) == value
+
+
+@pytest.mark.asyncio
+async def test_scheduled_flush_writes_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    release = threading.Event()
+    writer_threads = []
+    replace_file = StorageManager._replace_file
+
+    def blocking_replace(path, raw):
+        writer_threads.append(threading.current_thread())
+        release.wait(timeout=5)
+        replace_file(path, raw)
+
+    monkeypatch.setattr(storage, "_replace_file", blocking_replace)
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "1"}})
+    storage._scheduled_flush()
+
+    # The write is still blocked in the writer thread, yet reads see it.
+    assert storage.get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "1"}}
+    release.set()
+    storage.flush()
+
+    assert writer_threads and threading.main_thread() not in writer_threads
+    assert StorageManager(tmp_path).get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "1"}}
+    assert storage._writing == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_background_write_is_kept_and_retried(tmp_path, monkeypatch):
+    import asyncio
+
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    replace_file = StorageManager._replace_file
+
+    def failing_replace(path, raw):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage, "_replace_file", failing_replace)
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "1"}})
+    with pytest.raises(OSError):
+        storage.flush()
+
+    # The payload stays readable and a retry is scheduled on the loop.
+    assert storage.get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "1"}}
+    await asyncio.sleep(0)
+    assert storage._flush_handle is not None
+
+    monkeypatch.setattr(storage, "_replace_file", replace_file)
+    storage.flush()
+
+    assert StorageManager(tmp_path).get_alliance_sheet_cache() == {"HoJ": {"fetched_at": "1"}}
+    assert storage._failed_writes == {}
+
+
+def test_dataclasses_are_written_without_asdict(tmp_path):
+    from dataclasses import asdict
+
+    import orjson
+
+    from axitools.storage import JSON_WRITE_OPTIONS, CompSchedule, GuildConfig, StorageManager
+
+    storage = StorageManager(tmp_path)
+    config = GuildConfig.default()
+    config.guild_role_ids = {"Guild": 10}
+    config.comp_schedules = [CompSchedule(schedule_id="s1", name="Raid", post_days=[1], signups={"Guardian": [5]})]
+    storage.save_config(1, config)
+
+    written = (tmp_path / "guild_1" / "config.json").read_bytes()
+    assert written == orjson.dumps(asdict(config), option=JSON_WRITE_OPTIONS)
+    assert StorageManager(tmp_path).get_config(1).comp_schedules[0].signups == {"Guardian": [5]}
+
+
+def test_rss_feeds_are_cached_and_isolated_from_callers(tmp_path):
+    from axitools.storage import RssFeedConfig, StorageManager
+
+    storage = StorageManager(tmp_path)
+    storage.upsert_rss_feed(3, RssFeedConfig(name="News", url="https://example.com/rss", channel_id=9))
+    with storage.record_store._conn() as connection:
+        connection.execute("DELETE FROM rss_feeds")
+
+    feed = storage.find_rss_feed(3, "news")
+    feed.last_entry_id = "changed locally"
+    assert storage.find_rss_feed(3, "NEWS").last_entry_id is None
+    assert [item.name for item in storage.get_rss_feeds(3)] == ["News"]
+
+    storage.invalidate(3)
+    assert storage.get_rss_feeds(3) == []
+
+
+def test_rss_feed_upsert_and_delete_update_index_in_place(tmp_path):
+    from axitools.storage import RssFeedConfig, StorageManager
+
+    storage = StorageManager(tmp_path)
+    storage.upsert_rss_feed(4, RssFeedConfig(name="News", url="https://a/rss", channel_id=1))
+    storage.upsert_rss_feed(4, RssFeedConfig(name="Patch", url="https://b/rss", channel_id=1))
+    storage.upsert_rss_feed(4, RssFeedConfig(name="NEWS", url="https://c/rss", channel_id=2))
+
+    assert [(feed.name, feed.url) for feed in storage.get_rss_feeds(4)] == [
+        ("NEWS", "https://c/rss"),
+        ("Patch", "https://b/rss"),
+    ]
+    assert storage.delete_rss_feed(4, "patch") is True
+    assert storage.delete_rss_feed(4, "patch") is False
+    assert [feed.name for feed in StorageManager(tmp_path).get_rss_feeds(4)] == ["NEWS"]
+
+
+def test_json_is_written_compactly_in_production(tmp_path, monkeypatch):
+    import orjson
+
+    from axitools import storage as storage_module
+
+    monkeypatch.setattr(storage_module, "JSON_WRITE_OPTIONS", orjson.OPT_NON_STR_KEYS)
+    storage = storage_module.StorageManager(tmp_path)
+    storage.save_alliance_sheet_cache({"HoJ": {"fetched_at": "1"}})
+
+    assert (tmp_path / "alliance_sheets.json").read_bytes() == b'{"HoJ":{"fetched_at":"1"}}'
+
+
+def test_guild_path_is_created_once(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from axitools.storage import StorageManager
+
+    storage = StorageManager(tmp_path)
+    calls = []
+    original_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    storage.get_rss_feeds(5)
+    storage.get_arcdps_status(5)
+
+    assert calls == [tmp_path / "guild_5"]
+
+
+def test_large_json_files_are_read_through_mmap(tmp_path):
+    from axitools.storage import MMAP_READ_THRESHOLD, StorageManager
+
+    sheets = {f"sheet-{index}": {"fetched_at": "x" * 64} for index in range(MMAP_READ_THRESHOLD // 32)}
+    StorageManager(tmp_path).save_alliance_sheet_cache(sheets)
+    assert (tmp_path / "alliance_sheets.json").stat().st_size >= MMAP_READ_THRESHOLD
+
+    assert StorageManager(tmp_path).get_alliance_sheet_cache() == sheets
+
+
+def test_status_documents_are_cached_per_guild(tmp_path, monkeypatch):
+    from axitools.storage import ArcDpsStatus, StorageManager, UpdateNotesStatus
+
+    storage = StorageManager(tmp_path)
+    assert storage.get_arcdps_status(6) is None
+    storage.save_arcdps_status(6, ArcDpsStatus(last_checked_at="a"))
+    storage.save_update_notes_status(6, UpdateNotesStatus(last_entry_id="1"))
+
+    reads = []
+    monkeypatch.setattr(storage, "_read_json", lambda path, default: reads.append(path) or default)
+    status = storage.get_arcdps_status(6)
+    status.last_checked_at = "changed locally"
+    assert storage.get_arcdps_status(6).last_checked_at == "a"
+    assert storage.get_update_notes_status(6).last_entry_id == "1"
+    assert storage.get_update_notes_status(7) is None
+    assert storage.get_update_notes_status(7) is None
+    assert reads == [tmp_path / "guild_7" / "update_notes.json"]
+
+
+def test_comp_presets_round_trip_without_runtime_fields(tmp_path):
+    from axitools.storage import CompClassConfig, CompConfig, CompPreset, StorageManager
+
+    config = CompConfig(
+        post_days=[2],
+        classes=[CompClassConfig(name="Firebrand", required=2)],
+        signups={"Firebrand": [1]},
+        message_id=99,
+    )
+    StorageManager(tmp_path).save_comp_presets(1, [CompPreset(name="Raid", config=config)])
+
+    (preset,) = StorageManager(tmp_path).get_comp_presets(1)
+    assert preset.name == "Raid"
+    assert preset.config.classes == [CompClassConfig(name="Firebrand", required=2)]
+    assert preset.config.signups == {}
+    assert preset.config.message_id is None
+
+
+def test_legacy_build_and_feed_json_is_imported_once(tmp_path):
+    import orjson
+
+    from axitools.storage import StorageManager
+
+    guild_dir = tmp_path / "guild_9"
+    guild_dir.mkdir()
+    (guild_dir / "builds.json").write_bytes(
+        orjson.dumps(
+            [
+                {
+                    "build_id": "a",
+                    "name": "Legacy",
+                    "profession": "Guardian",
+                    "specialization": None,
+                    "url": None,
+                    "chat_code": "[&AA==]",
+                    "description": None,
+                    "created_by": 1,
+                    "created_at": "2024-01-01T00:00:00.000000Z",
+                    "updated_by": 1,
+                    "updated_at": "2024-01-01T00:00:00.000000Z",
+                }
+            ]
+        )
+    )
+    (guild_dir / "rss_feeds.json").write_bytes(
+        orjson.dumps([{"name": "News", "url": "https://example.com/rss", "channel_id": 3}])
+    )
+
+    storage = StorageManager(tmp_path)
+    assert [build.name for build in storage.get_builds(9)] == ["Legacy"]
+    assert storage.find_rss_feed(9, "news").channel_id == 3
+
+    assert storage.delete_build(9, "a") is True
+    assert StorageManager(tmp_path).get_builds(9) == []
+
+
+def test_legacy_import_skips_invalid_rows(tmp_path, caplog):
+    import orjson
+
+    from axitools.storage import StorageManager
+
+    guild_dir = tmp_path / "guild_9"
+    guild_dir.mkdir()
+    (guild_dir / "rss_feeds.json").write_bytes(
+        orjson.dumps(
+            [
+                {"name": "x", "url": None, "channel_id": 1},
+                {"name": "News", "url": "https://example.com/rss", "channel_id": 3},
+                {"name": "Extra", "unknown": True},
+            ]
+        )
+    )
+
+    with caplog.at_level("WARNING"):
+        storage = StorageManager(tmp_path)
+
+    assert [feed.name for feed in storage.get_rss_feeds(9)] == ["News"]
+    assert sum("Skipping invalid entry" in record.getMessage() for record in caplog.records) == 2
+
+
+def test_unchanged_saves_skip_the_disk_write(tmp_path, monkeypatch):
+    from axitools.storage import ArcDpsStatus, StorageManager
+
+    storage = StorageManager(tmp_path)
+    writes = []
+    replace_file = StorageManager._replace_file
+
+    def recording_replace(path, raw):
+        writes.append(path.name)
+        replace_file(path, raw)
+
+    monkeypatch.setattr(storage, "_replace_file", recording_replace)
+    storage.save_arcdps_status(1, ArcDpsStatus(last_checked_at="a"))
+    storage.save_arcdps_status(1, ArcDpsStatus(last_checked_at="a"))
+    assert writes == ["arcdps.json"]
+
+    storage.save_arcdps_status(1, ArcDpsStatus(last_checked_at="b"))
+    storage.invalidate(1)
+    storage.save_arcdps_status(1, ArcDpsStatus(last_checked_at="b"))
+    assert writes == ["arcdps.json", "arcdps.json", "arcdps.json"]
+
+
+def test_unchanged_feed_upsert_skips_the_database(tmp_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    from axitools.storage import RssFeedConfig, StorageManager
+
+    storage = StorageManager(tmp_path)
+    feed = RssFeedConfig(name="News", url="https://example.com/rss", channel_id=1)
+    storage.upsert_rss_feed(2, feed)
+    upsert = MagicMock()
+    monkeypatch.setattr(storage.record_store, "upsert_rss_feed", upsert)
+
+    storage.upsert_rss_feed(2, RssFeedConfig(name="News", url="https://example.com/rss", channel_id=1))
+    upsert.assert_not_called()
+
+
+def test_api_key_json_columns_round_trip_as_text(api_key_store):
+    record = ApiKeyRecord(
+        name="k",
+        key="KEY",
+        permissions=["account"],
+        guild_ids=["guild-1"],
+        guild_labels={"guild-1": "Guild [TAG]"},
+        characters=["Char"],
+    )
+    api_key_store.upsert_api_key(1, 2, record)
+
+    conn = api_key_store._connect()
+    row = conn.execute("SELECT guild_labels, characters FROM api_keys").fetchone()
+    conn.close()
+    assert isinstance(row["guild_labels"], str)
+    [(_, _, stored)] = api_key_store.all_api_keys()
+    assert stored.guild_labels == {"guild-1": "Guild [TAG]"}
+    assert stored.characters == ["Char"]
+
+
+def test_api_key_store_reuses_one_connection_and_rolls_back_on_error(api_key_store):
+    api_key_store.upsert_api_key(1, 2, ApiKeyRecord(name="k", key="KEY"))
+    with api_key_store._conn() as first:
+        pass
+    with api_key_store._conn() as second:
+        pass
+    assert first is second
+
+    with pytest.raises(RuntimeError):
+        with api_key_store._conn() as connection:
+            connection.execute("DELETE FROM api_keys")
+            raise RuntimeError("boom")
+    assert api_key_store.count_api_keys(1) == 1
+
+
+def test_save_user_api_keys_replaces_keys_and_guild_links(api_key_store):
+    api_key_store.save_user_api_keys(1, 2, [ApiKeyRecord(name="old", key="OLD", guild_ids=["aaaa-1111"])])
+    api_key_store.save_user_api_keys(
+        1,
+        2,
+        [
+            ApiKeyRecord(name=" Main ", key="KEY-1", guild_ids=["bbbb-2222", "cccc-3333"]),
+            ApiKeyRecord(name="Alt", key="KEY-2", guild_ids=["bbbb-2222"]),
+            ApiKeyRecord(name="blank", key="  "),
+        ],
+    )
+
+    assert [record.name for record in api_key_store.get_user_api_keys(1, 2)] == ["Alt", "Main"]
+    linked = api_key_store.query_api_keys(guild_id=1, gw2_guild_id="bbbb-2222")
+    assert sorted(record.name for _, _, record in linked) == ["Alt", "Main"]
+    assert api_key_store.query_api_keys(guild_id=1, gw2_guild_id="aaaa-1111") == []
+
+
+def test_normalise_timezone_strips_invisible_and_control_characters():
+    from axitools.storage import normalise_timezone
+
+    assert normalise_timezone("\u200bEurope/Berlin\x00") == "Europe/Berlin"
+    assert normalise_timezone("\u00a0America/New_York\u202f") == "America/New_York"
+    assert normalise_timezone("Etc/\u2066GMT\u2069\U000e0041") == "Etc/GMT"
+    assert normalise_timezone("  US/\t Pacific ") == "US/ Pacific"
+    assert normalise_timezone(None) == "UTC"
+
+
+def test_normalise_guild_id_keeps_only_hex_and_dashes():
+    from axitools.storage import normalise_guild_id
+
+    assert normalise_guild_id("  ABCDEF12-3456\u200b ") == "abcdef12-3456"
+    assert normalise_guild_id("g\u00e9uild_\uff21-9z") == "d-9"
+    assert normalise_guild_id("") == ""
+
+
+def test_normalisers_are_memoised():
+    from axitools import storage
+
+    storage.normalise_guild_id.cache_clear()
+    storage._normalise_timezone_text.cache_clear()
+
+    assert storage.normalise_guild_id(" ABC-123 ") == "abc-123"
+    assert storage.normalise_guild_id(" ABC-123 ") == "abc-123"
+    assert storage.normalise_guild_id.cache_info().hits == 1
+
+    assert storage.normalise_timezone("Europe/Berlin") == "Europe/Berlin"
+    assert storage.normalise_timezone("Europe/Berlin") == "Europe/Berlin"
+    assert storage._normalise_timezone_text.cache_info().hits == 1
+
+    # Unhashable payload values are stringified before the cache lookup
+    assert storage.normalise_timezone(["UTC"]) == "['UTC']"